@@ -0,0 +1,88 @@
+"""Concurrent socket-handler style queries through the instrumented pool.
+
+    cd Backend && python benchmarks/bench_db_pool.py [handlers] [queries_per_handler]
+
+Spawns green threads that each check out a connection, run a short query and
+return it, the way ``handle_message``/``handle_join`` do. Point ``DATABASE_URL``
+at a local Postgres to measure the effect of the green psycopg2 wait callback
+(each query is a 10 ms ``pg_sleep``, so a blocking driver serializes them);
+without it a SQLite file stands in and only pool overhead is measured.
+"""
+import eventlet
+eventlet.monkey_patch()
+
+import os  # noqa: E402
+import sys  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from db_pool import InstrumentedQueuePool, make_psycopg2_green  # noqa: E402
+
+
+def run(url, handlers, queries, pool_size, green):
+    if url.startswith('postgresql'):
+        from psycopg2 import extensions
+        if green:
+            make_psycopg2_green()
+        else:
+            extensions.set_wait_callback(None)
+        query = text('SELECT pg_sleep(0.01)')
+    else:
+        query = text('SELECT 1')
+
+    engine = create_engine(url, poolclass=InstrumentedQueuePool,
+                           pool_size=pool_size, max_overflow=0, pool_timeout=60)
+    latencies = []
+
+    def handler():
+        for _ in range(queries):
+            started = time.perf_counter()
+            with engine.connect() as conn:
+                conn.execute(query)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    pool = eventlet.GreenPool(handlers)
+    for _ in range(handlers):
+        pool.spawn(handler)
+    pool.waitall()
+    elapsed = time.perf_counter() - started
+    stats = engine.pool.stats()
+    engine.dispose()
+
+    latencies.sort()
+    return {
+        'ops_per_s': len(latencies) / elapsed,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000,
+        'avg_checkout_ms': stats['avg_checkout_ms'],
+        'max_waiting': stats['max_waiting']
+    }
+
+
+def main():
+    handlers = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    url = os.getenv('DATABASE_URL')
+    if not url:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+
+    print(f"{handlers} handlers x {queries} queries against {url.split('@')[-1]}")
+    print(f"{'driver':<10}{'pool':>6}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}"
+          f"{'checkout ms':>13}{'max wait':>10}")
+    postgres = url.startswith('postgresql')
+    for green in ([True, False] if postgres else [True]):
+        driver = ('green' if green else 'blocking') if postgres else 'sqlite'
+        for pool_size in (5, 10, 20):
+            result = run(url, handlers, queries, pool_size, green)
+            print(f"{driver:<10}{pool_size:>6}{result['ops_per_s']:>10.0f}"
+                  f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+                  f"{result['avg_checkout_ms']:>13.2f}{result['max_waiting']:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Bytes per message and encode cost for Socket.IO payload codecs.
+
+    cd Backend && python benchmarks/bench_serialization.py [iterations]
+
+Compares the plain JSON payloads the server emits today against the compact
+MessagePack encoding negotiated with ``codec=msgpack``.
+"""
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import codec  # noqa: E402
+from pytz import timezone  # noqa: E402
+
+IST = timezone('Asia/Kolkata')
+
+
+def sample_payloads():
+    now = datetime.now(IST).isoformat()
+    return {
+        'message': {
+            'id': 123456, 'sender_id': 42,
+            'message': 'Thanks, I restarted the router and it works now.',
+            'timestamp': now
+        },
+        'message_sent': {'success': True, 'message': 'ok', 'timestamp': now},
+        'ticket_closed': {
+            'ticket_id': '98765', 'reason': 'Resolved by customer',
+            'reassigned_to': None, 'seq': 1234567
+        },
+        'new_ticket (25 batched)': {
+            'tickets': [{'ticket_id': 1000 + i, 'category': 'network', 'urgency': 'high', 'seq': 5000 + i}
+                        for i in range(25)],
+            'seq': 5024
+        }
+    }
+
+
+def bench(fn, payload, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        encoded = fn(payload)
+    elapsed = time.perf_counter() - started
+    return len(encoded), elapsed / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    if codec.msgpack is None:
+        print('msgpack is not installed; only JSON can be measured')
+    encoders = {'json': lambda p: json.dumps(p, separators=(',', ':')).encode()}
+    if codec.msgpack is not None:
+        encoders['msgpack'] = lambda p: codec.encode(p, codec.MSGPACK)
+
+    print(f"{'event':<26}{'codec':<10}{'bytes':>8}{'encode us':>12}")
+    for event, payload in sample_payloads().items():
+        for name, fn in encoders.items():
+            size, micros = bench(fn, payload, iterations)
+            print(f"{event:<26}{name:<10}{size:>8}{micros:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
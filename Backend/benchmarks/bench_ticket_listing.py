@@ -0,0 +1,175 @@
+"""Peak memory and latency of a full admin ticket listing.
+
+    cd Backend && python benchmarks/bench_ticket_listing.py [tickets]
+
+``orm+list`` is the old path: load every ticket as an ORM object, build a
+list of dicts and encode it in one go. ``core+stream`` is the streaming path
+used by ``GET /api/tickets`` without paging: a Core select over the listed
+columns read in ``yield_per`` batches and encoded chunk by chunk with
+``json_stream``. Each mode runs in a fresh process; peak RSS is reported as
+growth over the process after imports and connecting.
+Uses ``DATABASE_URL`` if set (e.g. a scratch Postgres database), otherwise a
+temporary SQLite file.
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import (  # noqa: E402
+    Column, DateTime, Integer, String, Text, create_engine, insert, select
+)
+from sqlalchemy.orm import Session, declarative_base  # noqa: E402
+
+import json_stream  # noqa: E402
+
+Base = declarative_base()
+
+
+class BenchTicket(Base):
+    __tablename__ = 'bench_listing_tickets'
+    id = Column(Integer, primary_key=True)
+    category = Column(String(50), nullable=False)
+    urgency = Column(String(20), nullable=False)
+    status = Column(String(20), nullable=False)
+    user_id = Column(Integer, nullable=False)
+    assigned_to = Column(Integer)
+    created_at = Column(DateTime, nullable=False)
+    closure_reason = Column(Text)
+    reassigned_to = Column(Integer)
+    last_message_at = Column(DateTime)
+    description = Column(Text, nullable=False)
+
+
+COLUMNS = (
+    'id', 'category', 'urgency', 'status', 'user_id', 'assigned_to', 'created_at',
+    'closure_reason', 'reassigned_to', 'last_message_at', 'description'
+)
+CHUNK_SIZE = 1000
+
+
+def serialize(t):
+    return {
+        'id': t.id,
+        'category': t.category,
+        'urgency': t.urgency,
+        'status': t.status,
+        'user_id': t.user_id,
+        'assigned_to': t.assigned_to,
+        'created_at': t.created_at.isoformat() if t.created_at else None,
+        'closure_reason': t.closure_reason,
+        'reassigned_to': t.reassigned_to,
+        'last_message_at': t.last_message_at.isoformat() if t.last_message_at else None,
+        'description': t.description
+    }
+
+
+def listing_orm(engine):
+    with Session(engine) as session:
+        body = json.dumps([serialize(t) for t in session.query(BenchTicket).all()],
+                          separators=(',', ':')).encode()
+        yield body
+
+
+def listing_stream(engine):
+    table = BenchTicket.__table__
+    with Session(engine) as session:
+        rows = session.execute(
+            select(*(table.c[name] for name in COLUMNS)).execution_options(yield_per=CHUNK_SIZE))
+        yield from json_stream.iter_array(rows, rows.keys(), CHUNK_SIZE)
+
+
+MODES = {'orm+list': listing_orm, 'core+stream': listing_stream}
+
+
+def max_rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def seed(engine, n_tickets):
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    started = datetime(2024, 1, 1)
+    statuses = ('open', 'assigned', 'closed', 'rejected')
+    batch = []
+    with engine.begin() as conn:
+        for i in range(1, n_tickets + 1):
+            status = statuses[i % len(statuses)]
+            batch.append({
+                'id': i,
+                'category': ('network', 'billing', 'hardware', 'account')[i % 4],
+                'urgency': ('High', 'Medium', 'Low')[i % 3],
+                'status': status,
+                'user_id': i % 5000 + 1,
+                'assigned_to': i % 50 + 1 if status in ('assigned', 'closed') else None,
+                'created_at': started + timedelta(minutes=i),
+                'closure_reason': 'Resolved' if status == 'closed' else None,
+                'last_message_at': started + timedelta(minutes=i + 30) if status != 'open' else None,
+                'description': f'Ticket {i}: the connection keeps dropping every few minutes '
+                               f'since the last update, restarting does not help.'
+            })
+            if len(batch) == 5000:
+                conn.execute(insert(BenchTicket), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(BenchTicket), batch)
+
+
+def measure(url, mode):
+    """Child process: run one listing and print its numbers as JSON."""
+    engine = create_engine(url)
+    with engine.connect():
+        pass
+    baseline = max_rss_mb()
+    started = time.perf_counter()
+    first_byte = None
+    size = 0
+    for chunk in MODES[mode](engine):
+        if first_byte is None:
+            first_byte = time.perf_counter() - started
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+    print(json.dumps({
+        'first_byte_ms': first_byte * 1000,
+        'total_ms': elapsed * 1000,
+        'bytes': size,
+        'peak_rss_mb': max_rss_mb() - baseline
+    }))
+    engine.dispose()
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--measure':
+        measure(sys.argv[2], sys.argv[3])
+        return
+
+    n_tickets = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    url = os.getenv('DATABASE_URL') or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    engine = create_engine(url)
+    seed(engine, n_tickets)
+
+    encoder = 'orjson' if json_stream.orjson is not None else 'json'
+    print(f"Full listing of {n_tickets} tickets on {engine.dialect.name} (stream encoder: {encoder})")
+    print(f"{'mode':<14}{'first byte ms':>15}{'total ms':>10}{'MB out':>8}{'peak RSS +MB':>14}")
+    try:
+        for mode in MODES:
+            out = subprocess.run([sys.executable, __file__, '--measure', url, mode],
+                                 check=True, capture_output=True, text=True).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            print(f"{mode:<14}{result['first_byte_ms']:>15.0f}{result['total_ms']:>10.0f}"
+                  f"{result['bytes'] / 1e6:>8.1f}{result['peak_rss_mb']:>14.1f}")
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""Many members accepting the same tickets at once.
+
+    cd Backend && python benchmarks/bench_ticket_transitions.py [tickets] [members]
+
+Every member thread tries to accept every ticket (in its own random order).
+``conditional`` uses the ticket state machine's single ``UPDATE ... WHERE
+status='open' RETURNING``; ``read-check-write`` is the old pattern of loading
+the ticket, checking its status in Python and then writing. A correct run has
+exactly one winner per ticket. Uses ``DATABASE_URL`` if set (e.g. a scratch
+Postgres database), otherwise a temporary SQLite file.
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import (  # noqa: E402
+    Column, DateTime, Integer, MetaData, String, Table, create_engine, select, update
+)
+from sqlalchemy.orm import Session  # noqa: E402
+
+from ticket_state import TicketStateMachine  # noqa: E402
+
+metadata = MetaData()
+tickets = Table(
+    'bench_tickets', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('status', String(20), nullable=False),
+    Column('assigned_to', Integer),
+    Column('last_message_at', DateTime)
+)
+states = TicketStateMachine(tickets)
+
+
+def accept_conditional(session, ticket_id, member_id):
+    result = states.apply(session, 'accept', ticket_id, values={'assigned_to': member_id})
+    session.commit()
+    return result.ok
+
+
+def accept_read_check_write(session, ticket_id, member_id):
+    row = session.execute(select(tickets).where(tickets.c.id == ticket_id)).first()
+    session.commit()
+    if row.status != 'open':
+        return False
+    time.sleep(0)  # stand-in for the round trip between the read and the write
+    session.execute(update(tickets).where(tickets.c.id == ticket_id)
+                    .values(status='assigned', assigned_to=member_id))
+    session.commit()
+    return True
+
+
+def run(engine, accept, n_tickets, n_members):
+    with engine.begin() as conn:
+        conn.execute(tickets.delete())
+        conn.execute(tickets.insert(), [{'id': i, 'status': 'open'} for i in range(1, n_tickets + 1)])
+
+    wins = Counter()
+    errors = Counter()
+    lock = threading.Lock()
+    barrier = threading.Barrier(n_members)
+
+    def member(member_id):
+        order = list(range(1, n_tickets + 1))
+        random.shuffle(order)
+        with Session(engine) as session:
+            barrier.wait()
+            for ticket_id in order:
+                try:
+                    won = accept(session, ticket_id, member_id)
+                except Exception as e:
+                    session.rollback()
+                    with lock:
+                        errors[type(e).__name__] += 1
+                    continue
+                if won:
+                    with lock:
+                        wins[ticket_id] += 1
+
+    threads = [threading.Thread(target=member, args=(m,)) for m in range(1, n_members + 1)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    with engine.connect() as conn:
+        assigned = conn.execute(select(tickets.c.id).where(tickets.c.status == 'assigned')).all()
+    return {
+        'attempts_per_s': n_tickets * n_members / elapsed,
+        'assigned': len(assigned),
+        'double_accepts': sum(1 for count in wins.values() if count > 1),
+        'errors': dict(errors)
+    }
+
+
+def main():
+    n_tickets = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    n_members = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    url = os.getenv('DATABASE_URL') or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    connect_args = {'timeout': 30, 'check_same_thread': False} if url.startswith('sqlite') else {}
+    engine = create_engine(url, pool_size=n_members, max_overflow=0, connect_args=connect_args)
+    metadata.create_all(engine)
+
+    print(f"{n_members} members racing for {n_tickets} tickets on {engine.dialect.name}")
+    print(f"{'mode':<20}{'attempts/s':>12}{'assigned':>10}{'double accepts':>16}  errors")
+    try:
+        for name, accept in (('conditional', accept_conditional),
+                             ('read-check-write', accept_read_check_write)):
+            result = run(engine, accept, n_tickets, n_members)
+            print(f"{name:<20}{result['attempts_per_s']:>12.0f}{result['assigned']:>10}"
+                  f"{result['double_accepts']:>16}  {result['errors'] or '-'}")
+    finally:
+        metadata.drop_all(engine)
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,355 @@
+"""End-to-end load test of the ticket and chat lifecycle.
+
+    cd Backend && python benchmarks/load_test.py --users 50 --members 10 --messages 50
+
+Starts the app in a subprocess (a throwaway SQLite file unless ``--database-url``
+points elsewhere, e.g. a scratch Postgres database), then drives it with real
+REST and Socket.IO clients (``pip install requests "python-socketio[client]"``):
+
+    signup/login -> members connect -> ticket created -> new_ticket fan-out ->
+    accept -> both sides join -> burst of messages -> close -> reopen
+
+Each simulated user runs that lifecycle in its own thread against a pool of
+members. Throughput and p50/p99 latency per operation are printed as JSON
+(or written to ``--output``) so runs can be compared across commits.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+# The websocket client sends an Origin header; use the one the server allows
+ORIGIN = 'http://localhost:5173'
+
+
+def serve(port):
+    """Subprocess entry point: run the app without the debug reloader."""
+    import eventlet
+    eventlet.monkey_patch()
+    import logging
+    sys.path.insert(0, BACKEND_DIR)
+    import app as server
+    logging.getLogger().setLevel(logging.WARNING)
+    server.start_server()
+    server.socketio.run(server.app, host='127.0.0.1', port=port, debug=False,
+                        use_reloader=False, log_output=False)
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = defaultdict(list)
+        self._errors = defaultdict(int)
+        self._window = {}
+
+    def add(self, op, started, ended=None):
+        ended = time.perf_counter() if ended is None else ended
+        with self._lock:
+            self._samples[op].append(ended - started)
+            first, last = self._window.get(op, (started, ended))
+            self._window[op] = (min(first, started), max(last, ended))
+
+    def error(self, op):
+        with self._lock:
+            self._errors[op] += 1
+
+    def timed(self, op, fn, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.error(op)
+            raise
+        self.add(op, started)
+        return result
+
+    def report(self):
+        out = {}
+        with self._lock:
+            for op in sorted(set(self._samples) | set(self._errors)):
+                samples = sorted(self._samples.get(op, []))
+                first, last = self._window.get(op, (0.0, 0.0))
+                out[op] = {
+                    'count': len(samples),
+                    'errors': self._errors.get(op, 0),
+                    'throughput_per_s': round(len(samples) / (last - first), 2) if last > first else None,
+                    'p50_ms': round(samples[len(samples) // 2] * 1000, 3) if samples else None,
+                    'p99_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 3)
+                    if samples else None
+                }
+        return out
+
+
+class Api:
+    def __init__(self, base_url, recorder):
+        import requests
+        self.base_url = base_url
+        self.recorder = recorder
+        self.http = requests.Session()
+
+    def call(self, op, method, path, token=None, **kwargs):
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+
+        def send():
+            response = self.http.request(method, self.base_url + path, headers=headers, timeout=30, **kwargs)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{op}: {response.status_code} {response.text[:200]}")
+            return response.json()
+        return self.recorder.timed(op, send)
+
+    def register(self, index, kind):
+        email = f'{kind}{index}@load.test'
+        user = self.call('signup', 'POST', '/api/auth/signup', json={
+            'firstName': kind, 'lastName': str(index), 'dob': '1990-01-01',
+            'email': email, 'phone': f'{kind[0]}{index:09d}', 'password': 'load-test'
+        })['user']
+        return {'id': user['id'], 'email': email}
+
+    def login(self, account):
+        account['token'] = self.call('login', 'POST', '/api/auth/login', json={
+            'email': account['email'], 'password': 'load-test'
+        })['access_token']
+        return account
+
+
+class SocketClient:
+    """Socket.IO client that can wait for specific server events."""
+
+    def __init__(self, base_url, account, recorder):
+        import socketio
+        self.account = account
+        self.recorder = recorder
+        self.sio = socketio.Client(reconnection=False, websocket_extra_options={'origin': ORIGIN})
+        self._lock = threading.Lock()
+        self._waiters = {}
+        self._pending_acks = deque()
+        self._acked = threading.Semaphore(0)
+        self.new_ticket_arrivals = {}
+        self.joined = set()
+        self.sio.on('connect_success', lambda data: self._resolve(('connect_success',)))
+        self.sio.on('joined', lambda data: self._resolve(('joined', str(data['room']))))
+        self.sio.on('message_sent', self._on_message_sent)
+        self.sio.on('message', self._on_message)
+        self.sio.on('new_ticket', self._on_new_ticket)
+        self._base_url = base_url
+
+    def _expect(self, key):
+        waiter = threading.Event()
+        with self._lock:
+            self._waiters[key] = waiter
+        return waiter
+
+    def _resolve(self, key):
+        with self._lock:
+            waiter = self._waiters.pop(key, None)
+        if waiter is not None:
+            waiter.set()
+
+    def _wait(self, op, waiter, started, timeout=30):
+        if not waiter.wait(timeout):
+            self.recorder.error(op)
+            raise TimeoutError(op)
+        self.recorder.add(op, started)
+
+    def connect(self):
+        waiter = self._expect(('connect_success',))
+        started = time.perf_counter()
+        self.sio.connect(f"{self._base_url}?token={self.account['token']}", transports=['websocket'])
+        self._wait('socket_connect', waiter, started)
+
+    def join(self, ticket_id):
+        waiter = self._expect(('joined', str(ticket_id)))
+        started = time.perf_counter()
+        self.sio.emit('join', {'ticket_id': ticket_id})
+        self._wait('join', waiter, started)
+        self.joined.add(str(ticket_id))
+
+    def send_burst(self, ticket_id, count, timeout=60):
+        for _ in range(count):
+            started = time.perf_counter()
+            with self._lock:
+                self._pending_acks.append(started)
+            self.sio.emit('message', {
+                'ticket_id': ticket_id,
+                'sender_id': self.account['id'],
+                'message': f'load-test {ticket_id} {started!r}'
+            })
+        deadline = time.monotonic() + timeout
+        for _ in range(count):
+            if not self._acked.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                self.recorder.error('message_ack')
+                raise TimeoutError('message_ack')
+
+    def _on_message_sent(self, data):
+        ended = time.perf_counter()
+        with self._lock:
+            started = self._pending_acks.popleft() if self._pending_acks else None
+        if started is not None:
+            self.recorder.add('message_ack', started, ended)
+            self._acked.release()
+
+    def _on_message(self, data):
+        # Delivery latency to the other side of the chat; ticket and send time ride in the text
+        parts = data.get('message', '').split(' ')
+        if len(parts) == 3 and parts[0] == 'load-test' and parts[1] in self.joined \
+                and data.get('sender_id') != self.account['id']:
+            self.recorder.add('message_delivery', float(parts[2]))
+
+    def _on_new_ticket(self, data):
+        arrived = time.perf_counter()
+        with self._lock:
+            for item in data.get('tickets', []):
+                self.new_ticket_arrivals.setdefault(item['ticket_id'], arrived)
+
+    def close(self):
+        self.sio.disconnect()
+
+
+def promote_admin(database_url, email):
+    from sqlalchemy import create_engine, text
+    engine = create_engine(database_url)
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE users SET role = 'admin' WHERE email = :email"), {'email': email})
+    engine.dispose()
+
+
+def wait_for_server(base_url, proc, timeout=60):
+    import requests
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError('Server exited during startup; see its log')
+        try:
+            if requests.get(f'{base_url}/metrics', timeout=1).ok:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError('Server did not start in time')
+
+
+def run_lifecycle(index, api, base_url, user, members, messages, recorder, created_at):
+    client = SocketClient(base_url, user, recorder)
+    client.connect()
+    try:
+        member, member_client = members[index % len(members)]
+        started = time.perf_counter()
+        ticket_id = api.call('create_ticket', 'POST', '/api/tickets', user['token'], json={
+            'category': 'network', 'urgency': ('low', 'medium', 'high')[index % 3],
+            'description': f'Load test ticket from user {index}'
+        })['ticket_id']
+        created_at[ticket_id] = started
+
+        api.call('accept_ticket', 'POST', f'/api/tickets/accept/{ticket_id}', member['token'])
+        member_client.join(ticket_id)
+        client.join(ticket_id)
+        client.send_burst(ticket_id, messages)
+        api.call('close_ticket', 'PUT', f'/api/tickets/{ticket_id}/close', member['token'],
+                 json={'reason': 'Load test complete'})
+        api.call('reopen_ticket', 'PUT', f'/api/tickets/{ticket_id}/reopen', user['token'])
+    finally:
+        client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--members', type=int, default=5)
+    parser.add_argument('--messages', type=int, default=20, help='messages per chat')
+    parser.add_argument('--database-url', help='defaults to a fresh SQLite file')
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port)
+        return
+
+    workdir = tempfile.mkdtemp(prefix='load-test-')
+    database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'load.db')}"
+    base_url = f'http://127.0.0.1:{args.port}'
+    env = dict(os.environ, DATABASE_URL=database_url,
+               TRANSCRIPT_ARCHIVE_DIR=os.path.join(workdir, 'archive'))
+    log_path = os.path.join(workdir, 'server.log')
+    with open(log_path, 'w') as log:
+        proc = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), '--serve', '--port', str(args.port)],
+            cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT
+        )
+    recorder = Recorder()
+    try:
+        wait_for_server(base_url, proc)
+        api = Api(base_url, recorder)
+        total = args.users + args.members + 1
+
+        with ThreadPoolExecutor(max_workers=min(total, 32)) as pool:
+            accounts = list(pool.map(
+                lambda i: api.register(i, 'user' if i < args.users else 'member'), range(total)))
+        users, member_accounts, admin = accounts[:args.users], accounts[args.users:-1], accounts[-1]
+        promote_admin(database_url, admin['email'])
+        api.login(admin)
+        for member in member_accounts:
+            api.call('set_role', 'PUT', f"/api/users/{member['id']}/role", admin['token'], json={'role': 'member'})
+        with ThreadPoolExecutor(max_workers=min(total, 32)) as pool:
+            list(pool.map(api.login, users + member_accounts))
+
+        members = []
+        for member in member_accounts:
+            member_client = SocketClient(base_url, member, recorder)
+            member_client.connect()
+            members.append((member, member_client))
+
+        created_at = {}
+        failures = []
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.users) as pool:
+            futures = [pool.submit(run_lifecycle, i, api, base_url, user, members,
+                                   args.messages, recorder, created_at)
+                       for i, user in enumerate(users)]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    failures.append(str(e))
+        elapsed = time.perf_counter() - started
+
+        for _, member_client in members:
+            for ticket_id, arrived in member_client.new_ticket_arrivals.items():
+                if ticket_id in created_at:
+                    recorder.add('new_ticket_fanout', created_at[ticket_id], arrived)
+            member_client.close()
+
+        report = {
+            'config': {
+                'users': args.users, 'members': args.members, 'messages_per_chat': args.messages,
+                'database': database_url.split('://')[0]
+            },
+            'lifecycle_seconds': round(elapsed, 3),
+            'failed_lifecycles': len(failures),
+            'failures': failures[:10],
+            'operations': recorder.report()
+        }
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+    body = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(body + '\n')
+    else:
+        print(body)
+    if failures:
+        print(f'Server log: {log_path}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
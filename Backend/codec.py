@@ -0,0 +1,65 @@
+"""Per-connection payload codecs for Socket.IO events.
+
+Clients ask for ``codec=msgpack`` on the connect query string; everyone else
+(and everyone when ``msgpack`` is not installed) gets plain JSON. MessagePack
+payloads are also compacted: ISO timestamp strings become epoch milliseconds
+and ``None`` fields are dropped.
+
+Sockets on a non-JSON codec join ``<room>#<codec>`` instead of ``<room>``, so a
+room emit is encoded once per codec actually in use rather than per socket.
+"""
+from datetime import datetime
+
+import pytz
+
+try:
+    import msgpack
+except ImportError:  # optional dependency; JSON is always available
+    msgpack = None
+
+JSON = 'json'
+MSGPACK = 'msgpack'
+
+TIMESTAMP_FIELDS = {'timestamp', 'created_at', 'last_message_at'}
+_IST = pytz.timezone('Asia/Kolkata')
+
+
+def negotiate(requested):
+    if requested == MSGPACK and msgpack is not None:
+        return MSGPACK
+    return JSON
+
+
+def codec_room(room, codec):
+    room = str(room)
+    return room if codec == JSON else f'{room}#{codec}'
+
+
+def _epoch_ms(value):
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = _IST.localize(dt)
+    return int(dt.timestamp() * 1000)
+
+
+def compact(data):
+    if isinstance(data, dict):
+        out = {}
+        for key, value in data.items():
+            if value is None:
+                continue
+            if key in TIMESTAMP_FIELDS and isinstance(value, str):
+                value = _epoch_ms(value)
+            else:
+                value = compact(value)
+            out[key] = value
+        return out
+    if isinstance(data, (list, tuple)):
+        return [compact(item) for item in data]
+    return data
+
+
+def encode(data, codec):
+    if codec == MSGPACK:
+        return msgpack.packb(compact(data), use_bin_type=True)
+    return data
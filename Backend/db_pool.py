@@ -0,0 +1,98 @@
+"""Database connection pool tuned for eventlet.
+
+Under ``eventlet.monkey_patch()`` psycopg2 still blocks in C while it waits
+on the server, freezing every green thread in the process. ``make_psycopg2_green``
+installs a psycogreen-style wait callback so those waits yield to the hub.
+``InstrumentedQueuePool`` records checkout latency, how many callers are
+waiting for a connection and how many are checked out.
+"""
+import threading
+import time
+
+from sqlalchemy.pool import QueuePool
+
+
+def eventlet_wait_callback(conn, timeout=-1):
+    """psycopg2 wait callback that parks the green thread instead of the process."""
+    from eventlet.hubs import trampoline
+    from psycopg2 import OperationalError, extensions
+
+    while True:
+        state = conn.poll()
+        if state == extensions.POLL_OK:
+            break
+        elif state == extensions.POLL_READ:
+            trampoline(conn.fileno(), read=True)
+        elif state == extensions.POLL_WRITE:
+            trampoline(conn.fileno(), write=True)
+        else:
+            raise OperationalError(f"Bad result from poll: {state!r}")
+
+
+def make_psycopg2_green():
+    """Return True if psycopg2 is installed and now cooperative."""
+    try:
+        from psycopg2 import extensions
+    except ImportError:
+        return False
+    extensions.set_wait_callback(eventlet_wait_callback)
+    return True
+
+
+class InstrumentedQueuePool(QueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._waiting = 0
+        self._max_waiting = 0
+        self._checkouts = 0
+        self._failed = 0
+        self._checkout_time = 0.0
+        self._max_checkout_time = 0.0
+
+    def connect(self):
+        with self._stats_lock:
+            self._waiting += 1
+            self._max_waiting = max(self._max_waiting, self._waiting)
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except Exception:
+            with self._stats_lock:
+                self._failed += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._stats_lock:
+                self._waiting -= 1
+                self._checkouts += 1
+                self._checkout_time += elapsed
+                self._max_checkout_time = max(self._max_checkout_time, elapsed)
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                'size': self.size(),
+                'max_overflow': self._max_overflow,
+                'in_use': self.checkedout(),
+                'idle': self.checkedin(),
+                'overflow': self.overflow(),
+                'waiting': self._waiting,
+                'max_waiting': self._max_waiting,
+                'checkouts': self._checkouts,
+                'failed_checkouts': self._failed,
+                'avg_checkout_ms': self._checkout_time / self._checkouts * 1000 if self._checkouts else 0.0,
+                'max_checkout_ms': self._max_checkout_time * 1000
+            }
+
+
+def engine_options(config):
+    """``SQLALCHEMY_ENGINE_OPTIONS`` built from the ``DB_POOL_*`` settings."""
+    return {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_POOL_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+        'pool_pre_ping': config['DB_POOL_PRE_PING']
+    }
@@ -0,0 +1,147 @@
+"""Read-replica routing for the Flask-SQLAlchemy session.
+
+Replicas are ordinary ``SQLALCHEMY_BINDS`` entries. A session that was told
+to ``route_reads`` sends plain SELECTs to one replica (round robin across
+sessions) and everything else to the primary: writes, ``FOR UPDATE`` reads,
+and every statement after the session's first write. A user who committed a
+write is pinned to the primary for ``sticky_window`` seconds so they read it
+back even if the replicas lag; the pin is kept in the shared backend, so it
+holds on every worker. A replica that cannot be reached is skipped for
+``retry_after`` seconds and the read falls back to the next one, then to the
+primary.
+"""
+import itertools
+import logging
+import threading
+import time
+
+from flask_sqlalchemy.session import Session
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaRouter:
+    def __init__(self, backend, replicas, writer=None, sticky_window=5.0, retry_after=30.0,
+                 key='db:recent_writes', clock=time.time):
+        self.backend = backend
+        self.replicas = list(replicas)
+        self.sticky_window = sticky_window
+        self.retry_after = retry_after
+        self.key = key
+        self._writer = writer
+        self._clock = clock
+        self._cycle = itertools.cycle(self.replicas)
+        self._down = {}
+        self._lock = threading.Lock()
+        self.stats = {'replica_sessions': 0, 'sticky_sessions': 0, 'primary_fallbacks': 0, 'replica_errors': 0}
+
+    def writer(self):
+        return self._writer() if self._writer is not None else None
+
+    def mark_write(self, user_id):
+        if user_id is not None and self.replicas:
+            self.backend.hset(self.key, {str(user_id): str(self._clock() + self.sticky_window)})
+
+    def is_sticky(self, user_id):
+        if user_id is None:
+            return False
+        until = self.backend.hget(self.key, str(user_id))
+        if until is None:
+            return False
+        if float(until) > self._clock():
+            return True
+        self.backend.hdel(self.key, str(user_id))
+        return False
+
+    def mark_down(self, replica):
+        with self._lock:
+            self._down[replica] = self._clock() + self.retry_after
+        self.stats['replica_errors'] += 1
+
+    def pick(self, exclude=()):
+        """Next healthy replica bind key, or None when the primary has to serve."""
+        now = self._clock()
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                replica = next(self._cycle)
+                if replica not in exclude and self._down.get(replica, 0) <= now:
+                    return replica
+        return None
+
+    def choose(self, user_id):
+        if not self.replicas:
+            return None
+        if self.is_sticky(user_id):
+            self.stats['sticky_sessions'] += 1
+            return None
+        replica = self.pick()
+        if replica is None:
+            self.stats['primary_fallbacks'] += 1
+        else:
+            self.stats['replica_sessions'] += 1
+        return replica
+
+    def health(self):
+        now = self._clock()
+        with self._lock:
+            return {replica: self._down.get(replica, 0) <= now for replica in self.replicas}
+
+
+class RoutingSession(Session):
+    def __init__(self, db, router=None, **kwargs):
+        super().__init__(db, **kwargs)
+        self.router = router
+        self.replica = None
+        self._wrote = False
+
+    def route_reads(self, user_id=None):
+        """Serve this session's reads from a replica unless ``user_id`` wrote recently."""
+        if self.router is not None and not self._wrote:
+            self.replica = self.router.choose(user_id)
+        return self.replica
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or isinstance(clause, UpdateBase):
+                # Writes go to the primary, and so does the rest of the session
+                # so it reads its own writes
+                self._wrote = True
+                self.replica = None
+            elif (self.replica is not None and isinstance(clause, Select)
+                  and clause._for_update_arg is None):
+                engine = self._replica_engine()
+                if engine is not None:
+                    return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _replica_engine(self):
+        tried = set()
+        while self.replica is not None:
+            engine = self._db.engines[self.replica]
+            try:
+                # Check out the replica connection now (the session keeps it for
+                # the transaction) so an unreachable replica can be skipped
+                self._connection_for_bind(engine)
+                return engine
+            except DBAPIError as e:
+                logger.error(f"Replica {self.replica} unavailable, falling back: {str(e)}")
+                self.router.mark_down(self.replica)
+                tried.add(self.replica)
+                self.replica = self.router.pick(exclude=tried)
+                if self.replica is None:
+                    self.router.stats['primary_fallbacks'] += 1
+        return None
+
+    def commit(self):
+        super().commit()
+        if self._wrote:
+            self._wrote = False
+            if self.router is not None:
+                self.router.mark_write(self.router.writer())
+
+    def rollback(self):
+        super().rollback()
+        self._wrote = False
@@ -0,0 +1,90 @@
+"""Hashed timing wheel for per-ticket chat inactivity deadlines.
+
+``schedule``/``cancel`` are O(1) whatever the number of tracked tickets, so
+``handle_message`` can push a ticket's deadline back on every message. A
+``DeadlineScheduler`` advances the wheel once per tick and hands everything
+that expired to a callback in one batch.
+"""
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TimingWheel:
+    def __init__(self, tick=1.0, slots=4096, start=None):
+        self.tick = tick
+        self.slots = [set() for _ in range(slots)]
+        self._deadlines = {}
+        self._current = int((start if start is not None else time.time()) // tick)
+
+    def _index(self, deadline):
+        # Overdue keys land in the next slot to be visited rather than a full revolution away
+        return max(int(deadline // self.tick), self._current) % len(self.slots)
+
+    def schedule(self, key, deadline):
+        self.cancel(key)
+        index = self._index(deadline)
+        self._deadlines[key] = (deadline, index)
+        self.slots[index].add(key)
+
+    def cancel(self, key):
+        entry = self._deadlines.pop(key, None)
+        if entry is not None:
+            self.slots[entry[1]].discard(key)
+
+    def deadline(self, key):
+        entry = self._deadlines.get(key)
+        return entry[0] if entry else None
+
+    def __len__(self):
+        return len(self._deadlines)
+
+    def __contains__(self, key):
+        return key in self._deadlines
+
+    def advance(self, now):
+        """Pop and return every key whose deadline is at or before ``now``."""
+        target = int(now // self.tick)
+        expired = []
+        # A gap longer than one revolution only needs each slot visited once
+        first = max(self._current, target - len(self.slots) + 1)
+        for tick in range(first, target + 1):
+            slot = self.slots[tick % len(self.slots)]
+            due = [key for key in slot if self._deadlines[key][0] <= now]
+            for key in due:
+                slot.discard(key)
+                del self._deadlines[key]
+            expired.extend(due)
+        # The current slot may still hold keys due later within this tick
+        self._current = target
+        return expired
+
+
+class DeadlineScheduler:
+    def __init__(self, wheel, on_expired, sleep=time.sleep, clock=time.time, batch_size=500):
+        self.wheel = wheel
+        self._on_expired = on_expired
+        self._sleep = sleep
+        self._clock = clock
+        self.batch_size = batch_size
+        self.stats = {'ticks': 0, 'expired': 0, 'batches': 0, 'errors': 0}
+
+    def run_once(self):
+        expired = self.wheel.advance(self._clock())
+        self.stats['ticks'] += 1
+        for i in range(0, len(expired), self.batch_size):
+            batch = expired[i:i + self.batch_size]
+            try:
+                self._on_expired(batch)
+                self.stats['batches'] += 1
+                self.stats['expired'] += len(batch)
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.error(f"Error expiring {len(batch)} chat deadlines: {str(e)}")
+        return expired
+
+    def run_forever(self):
+        while True:
+            self.run_once()
+            self._sleep(self.wheel.tick)
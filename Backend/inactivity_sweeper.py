@@ -0,0 +1,66 @@
+"""Scheduled sweep that closes assigned tickets gone quiet.
+
+The SQL lives with the models in app.py (``close_chunk``); this component
+owns the schedule, chunking and metrics. Each chunk is one set-based
+``UPDATE ... RETURNING`` plus bulk inserts in its own short transaction, and
+the loop yields to the hub between chunks.
+"""
+import logging
+import time
+from datetime import timedelta
+
+logger = logging.getLogger(__name__)
+
+
+class InactivitySweeper:
+    def __init__(self, close_chunk, interval=3600, threshold=timedelta(hours=24),
+                 chunk_size=500, sleep=time.sleep, now=None):
+        self._close_chunk = close_chunk
+        self.interval = interval
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self._sleep = sleep
+        self._now = now
+        self.stats = {
+            'runs': 0,
+            'last_run_at': None,
+            'last_duration_ms': None,
+            'last_closed': 0,
+            'last_chunks': 0,
+            'total_closed': 0,
+            'errors': 0,
+            'last_error': None
+        }
+
+    def run_once(self):
+        started = time.monotonic()
+        cutoff = self._now() - self.threshold
+        closed = chunks = 0
+        try:
+            while True:
+                count = self._close_chunk(cutoff, self.chunk_size)
+                closed += count
+                chunks += 1
+                if count < self.chunk_size:
+                    break
+                self._sleep(0)
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.stats['last_error'] = str(e)
+            logger.error(f"Inactivity sweep failed: {str(e)}")
+        duration_ms = (time.monotonic() - started) * 1000
+        self.stats.update({
+            'runs': self.stats['runs'] + 1,
+            'last_run_at': time.time(),
+            'last_duration_ms': duration_ms,
+            'last_closed': closed,
+            'last_chunks': chunks,
+            'total_closed': self.stats['total_closed'] + closed
+        })
+        logger.info(f"Inactivity sweep closed {closed} tickets in {duration_ms:.1f} ms")
+        return closed
+
+    def run_forever(self):
+        while True:
+            self.run_once()
+            self._sleep(self.interval)
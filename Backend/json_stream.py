@@ -0,0 +1,49 @@
+"""Chunked JSON arrays straight from database rows.
+
+Large listings skip the ORM and the intermediate list: rows come from a
+server-side cursor, each one is encoded as soon as it arrives, and the encoded
+rows are flushed in chunks of ``chunk_size``. Memory stays at one chunk of
+rows and bytes no matter how long the result is. ``orjson`` is used when it
+is installed (it also encodes datetimes natively); otherwise the standard
+library encoder produces the same output.
+"""
+import json
+from datetime import date
+
+try:
+    import orjson
+except ImportError:  # optional dependency; the stdlib encoder is always available
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+if orjson is not None:
+    def dumps(data):
+        return orjson.dumps(data)
+else:
+    _encoder = json.JSONEncoder(separators=(',', ':'), default=_default)
+
+    def dumps(data):
+        return _encoder.encode(data).encode()
+
+
+def iter_array(rows, keys, chunk_size=1000):
+    """Yield a JSON array of ``rows`` (tuples in ``keys`` order) as byte chunks."""
+    keys = tuple(keys)
+    yield b'['
+    parts = []
+    first = True
+    for row in rows:
+        parts.append(dumps(dict(zip(keys, row))))
+        if len(parts) >= chunk_size:
+            yield (b'' if first else b',') + b','.join(parts)
+            first = False
+            parts = []
+    if parts:
+        yield (b'' if first else b',') + b','.join(parts)
+    yield b']'
@@ -0,0 +1,74 @@
+"""Write-behind batching for chat messages.
+
+Socket handlers ``submit`` messages; a single background task drains the
+queue for up to ``max_delay`` seconds or ``max_batch`` rows and hands the
+whole batch to ``flush``, which writes it in one transaction and only then
+emits to clients. If a batch fails it is split in half and each half retried,
+so one bad row only fails itself and the rest of the batch is still written.
+"""
+import logging
+import queue
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class MessageBatcher:
+    def __init__(self, flush, on_error=None, max_batch=200, max_delay=0.005):
+        self._flush = flush
+        self._on_error = on_error
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue = queue.Queue()
+        self._task = None
+        self.stats = {'batches': 0, 'messages': 0, 'failed_batches': 0, 'split_batches': 0,
+                      'failed_messages': 0, 'largest_batch': 0}
+
+    def start(self, start_background_task):
+        if self._task is None:
+            self._task = start_background_task(self._run)
+
+    def submit(self, item):
+        self._queue.put(item)
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        try:
+            self._flush(batch)
+            self.stats['messages'] += len(batch)
+        except Exception as e:
+            if len(batch) > 1:
+                self.stats['split_batches'] += 1
+                middle = len(batch) // 2
+                self._write(batch[:middle])
+                self._write(batch[middle:])
+                return
+            self.stats['failed_messages'] += 1
+            logger.error(f"Error flushing chat message: {str(e)}")
+            if self._on_error:
+                self._on_error(batch, e)
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            self.stats['batches'] += 1
+            self.stats['largest_batch'] = max(self.stats['largest_batch'], len(batch))
+            failed = self.stats['failed_messages']
+            self._write(batch)
+            if self.stats['failed_messages'] > failed:
+                self.stats['failed_batches'] += 1
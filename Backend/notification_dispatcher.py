@@ -0,0 +1,42 @@
+"""Coalesced, room-targeted notifications.
+
+Bursts of the same event to the same room within ``window`` seconds go out as
+one emit carrying the whole batch, instead of one frame per event per socket.
+"""
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDispatcher:
+    def __init__(self, emit, start_background_task, window=0.25, sleep=time.sleep):
+        self._emit = emit
+        self._start_background_task = start_background_task
+        self.window = window
+        self._sleep = sleep
+        self._pending = {}
+        self._flush_scheduled = False
+        self.stats = {'events': 0, 'emits': 0}
+
+    def dispatch(self, event, item, rooms):
+        for room in rooms:
+            self._pending.setdefault((event, room), []).append(item)
+        self.stats['events'] += 1
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._start_background_task(self._flush_after_window)
+
+    def _flush_after_window(self):
+        self._sleep(self.window)
+        self.flush()
+
+    def flush(self):
+        pending, self._pending = self._pending, {}
+        self._flush_scheduled = False
+        for (event, room), items in pending.items():
+            try:
+                self._emit(event, items, room)
+                self.stats['emits'] += 1
+            except Exception as e:
+                logger.error(f"Error emitting {event} to {room}: {str(e)}")
@@ -0,0 +1,61 @@
+"""Password hashing off the eventlet hub.
+
+PBKDF2 is CPU-bound; run inline it freezes every socket on the process.
+``PasswordHasher`` hands each hash to ``eventlet.tpool`` (native threads;
+hashlib releases the GIL while it works) and caps how many run at once, so a
+login storm queues cooperatively instead of starving chat traffic.
+"""
+import time
+
+from eventlet import tpool
+from eventlet.semaphore import Semaphore
+from werkzeug.security import generate_password_hash, check_password_hash
+
+
+class PasswordHasher:
+    def __init__(self, max_concurrency=4):
+        self.max_concurrency = max_concurrency
+        self._slots = Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.completed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_work = 0.0
+
+    def _run(self, fn, *args):
+        queued_at = time.monotonic()
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        with self._slots:
+            self.waiting -= 1
+            started_at = time.monotonic()
+            wait = started_at - queued_at
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.in_flight += 1
+            try:
+                return tpool.execute(fn, *args)
+            finally:
+                self.in_flight -= 1
+                self.completed += 1
+                self.total_work += time.monotonic() - started_at
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password)
+
+    def check(self, pwhash, password):
+        return self._run(check_password_hash, pwhash, password)
+
+    def stats(self):
+        return {
+            'max_concurrency': self.max_concurrency,
+            'in_flight': self.in_flight,
+            'waiting': self.waiting,
+            'max_waiting': self.max_waiting,
+            'completed': self.completed,
+            'avg_wait_ms': 1000 * self.total_wait / self.completed if self.completed else 0.0,
+            'max_wait_ms': 1000 * self.max_wait,
+            'avg_hash_ms': 1000 * self.total_work / self.completed if self.completed else 0.0
+        }
@@ -0,0 +1,298 @@
+"""Pub/sub backends shared by every worker process.
+
+A backend carries two things: Socket.IO room emits (through
+``BackendManager``) and the presence registry of connected sockets and their
+rooms. ``InProcessBackend`` is the single-process default; ``RedisBackend``
+speaks the Redis protocol so several eventlet workers can share state.
+"""
+import os
+import pickle
+import queue
+import socket
+import time
+from collections import defaultdict
+
+from socketio import PubSubManager
+
+
+class InProcessBackend:
+    """Dict-backed backend for a single process (and for tests)."""
+    shared = False
+
+    def __init__(self):
+        self._hashes = defaultdict(dict)
+        self._sets = defaultdict(set)
+        self._subscribers = defaultdict(list)
+
+    # Pub/sub
+    def publish(self, channel, data):
+        for subscriber in list(self._subscribers[channel]):
+            subscriber.put(data)
+
+    def listen(self, channel):
+        subscriber = queue.Queue()
+        self._subscribers[channel].append(subscriber)
+        try:
+            while True:
+                yield subscriber.get()
+        finally:
+            self._subscribers[channel].remove(subscriber)
+
+    # Hashes
+    def hset(self, key, mapping):
+        self._hashes[key].update(mapping)
+
+    def hget(self, key, field):
+        return self._hashes.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        return dict(self._hashes.get(key, {}))
+
+    def hdel(self, key, field):
+        self._hashes.get(key, {}).pop(field, None)
+
+    # Sets
+    def sadd(self, key, member):
+        self._sets[key].add(member)
+
+    def srem(self, key, member):
+        members = self._sets.get(key)
+        if members is not None:
+            members.discard(member)
+            if not members:
+                del self._sets[key]
+
+    def smembers(self, key):
+        return set(self._sets.get(key, ()))
+
+    def sismember(self, key, member):
+        return member in self._sets.get(key, ())
+
+    def scard(self, key):
+        return len(self._sets.get(key, ()))
+
+    def scard_many(self, *keys):
+        return [self.scard(key) for key in keys]
+
+    def delete(self, *keys):
+        for key in keys:
+            self._hashes.pop(key, None)
+            self._sets.pop(key, None)
+
+
+class RedisBackend:
+    """Backend for any server speaking the Redis protocol."""
+    shared = True
+
+    def __init__(self, url):
+        import redis  # optional dependency, only needed for multi-worker deployments
+        self._url = url
+        self.redis = redis.Redis.from_url(url, decode_responses=True)
+        self._pubsub_client = redis.Redis.from_url(url)
+
+    def publish(self, channel, data):
+        self._pubsub_client.publish(channel, data)
+
+    def listen(self, channel):
+        pubsub = self._pubsub_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(channel)
+        try:
+            for message in pubsub.listen():
+                if message and message.get('type') == 'message':
+                    yield message['data']
+        finally:
+            pubsub.close()
+
+    def hset(self, key, mapping):
+        self.redis.hset(key, mapping=mapping)
+
+    def hget(self, key, field):
+        return self.redis.hget(key, field)
+
+    def hgetall(self, key):
+        return self.redis.hgetall(key)
+
+    def hdel(self, key, field):
+        self.redis.hdel(key, field)
+
+    def sadd(self, key, member):
+        self.redis.sadd(key, member)
+
+    def srem(self, key, member):
+        self.redis.srem(key, member)
+
+    def smembers(self, key):
+        return self.redis.smembers(key)
+
+    def sismember(self, key, member):
+        return bool(self.redis.sismember(key, member))
+
+    def scard(self, key):
+        return self.redis.scard(key)
+
+    def scard_many(self, *keys):
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.scard(key)
+        return pipe.execute()
+
+    def delete(self, *keys):
+        if keys:
+            self.redis.delete(*keys)
+
+
+def create_backend(url=None):
+    if not url or url == 'memory://':
+        return InProcessBackend()
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisBackend(url)
+    raise ValueError(f"Unsupported message queue URL: {url}")
+
+
+class BackendManager(PubSubManager):
+    """Socket.IO client manager that fans emits out through a pub/sub backend."""
+    name = 'backend'
+
+    def __init__(self, backend, channel='socketio', write_only=False, logger=None):
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self.backend = backend
+
+    def _publish(self, data):
+        self.backend.publish(self.channel, pickle.dumps(data))
+
+    def _listen(self):
+        for message in self.backend.listen(self.channel):
+            yield pickle.loads(message)
+
+
+def create_client_manager(backend, channel='socketio'):
+    # A single process needs no fan-out; Socket.IO's default manager is enough
+    if not backend.shared:
+        return None
+    return BackendManager(backend, channel=channel)
+
+
+class PresenceRegistry:
+    """Connected sockets, their users and rooms, shared through a backend.
+
+    Reads mirror the old ``active_connections`` dict: ``sid in registry`` and
+    ``registry[sid]`` (``{'user_id': ..., 'rooms': {...}}``) still work, but
+    every write goes through ``connect``/``join``/``leave``/``disconnect``.
+    """
+
+    def __init__(self, backend, node_id=None, prefix='presence'):
+        self.backend = backend
+        self.node_id = node_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.prefix = prefix
+
+    def _key(self, *parts):
+        return ':'.join((self.prefix,) + tuple(str(p) for p in parts))
+
+    def connect(self, sid, user_id, **attrs):
+        self.backend.hset(self._key('conn', sid), {
+            'user_id': str(user_id),
+            'node': self.node_id,
+            **{k: str(v) for k, v in attrs.items()}
+        })
+        self.backend.sadd(self._key('sids'), sid)
+        self.backend.sadd(self._key('node', self.node_id), sid)
+        self.backend.sadd(self._key('user', user_id), sid)
+        self.backend.sadd(self._key('users'), str(user_id))
+
+    def disconnect(self, sid):
+        """Forget a socket and return the rooms it was in."""
+        conn = self.backend.hgetall(self._key('conn', sid))
+        rooms = self.backend.smembers(self._key('rooms', sid))
+        for room in rooms:
+            self._leave_room(sid, room)
+        if conn:
+            user_id = conn['user_id']
+            self.backend.srem(self._key('user', user_id), sid)
+            if not self.backend.scard(self._key('user', user_id)):
+                self.backend.srem(self._key('users'), user_id)
+            self.backend.srem(self._key('node', conn.get('node', self.node_id)), sid)
+        self.backend.srem(self._key('sids'), sid)
+        self.backend.delete(self._key('conn', sid), self._key('rooms', sid))
+        return rooms
+
+    def join(self, sid, room):
+        self.backend.sadd(self._key('rooms', sid), str(room))
+        self.backend.sadd(self._key('room', room), sid)
+        self.backend.sadd(self._key('room_names'), str(room))
+
+    def leave(self, sid, room):
+        self.backend.srem(self._key('rooms', sid), str(room))
+        self._leave_room(sid, room)
+
+    def _leave_room(self, sid, room):
+        self.backend.srem(self._key('room', room), sid)
+        if not self.backend.scard(self._key('room', room)):
+            self.backend.srem(self._key('room_names'), str(room))
+
+    def in_room(self, sid, room):
+        return self.backend.sismember(self._key('rooms', sid), str(room))
+
+    def rooms(self, sid):
+        return self.backend.smembers(self._key('rooms', sid))
+
+    def room_size(self, room):
+        return self.backend.scard(self._key('room', room))
+
+    def room_sizes(self, *rooms):
+        """Sizes of several rooms in one backend round trip."""
+        return self.backend.scard_many(*(self._key('room', room) for room in rooms))
+
+    def room_users(self, room):
+        return {self.user_id(sid) for sid in self.backend.smembers(self._key('room', room))} - {None}
+
+    def room_count(self):
+        return self.backend.scard(self._key('room_names'))
+
+    def user_id(self, sid):
+        return self.attr(sid, 'user_id')
+
+    def attr(self, sid, name):
+        return self.backend.hget(self._key('conn', sid), name)
+
+    def user_sids(self, user_id):
+        return self.backend.smembers(self._key('user', user_id))
+
+    def is_online(self, user_id):
+        return self.backend.sismember(self._key('users'), str(user_id))
+
+    def online_users(self):
+        return self.backend.smembers(self._key('users'))
+
+    def get(self, sid, default=None):
+        conn = self.backend.hgetall(self._key('conn', sid))
+        if not conn:
+            return default
+        return {**conn, 'rooms': self.rooms(sid)}
+
+    def __getitem__(self, sid):
+        data = self.get(sid)
+        if data is None:
+            raise KeyError(sid)
+        return data
+
+    def __contains__(self, sid):
+        return self.backend.sismember(self._key('sids'), sid)
+
+    def __len__(self):
+        return self.backend.scard(self._key('sids'))
+
+    # Node liveness, so a crashed worker's sockets do not linger as online
+    def heartbeat(self):
+        self.backend.hset(self._key('nodes'), {self.node_id: str(time.time())})
+
+    def purge_node(self, node_id):
+        for sid in self.backend.smembers(self._key('node', node_id)):
+            self.disconnect(sid)
+        self.backend.delete(self._key('node', node_id))
+        self.backend.hdel(self._key('nodes'), node_id)
+
+    def reap(self, stale_after):
+        now = time.time()
+        for node_id, last_seen in self.backend.hgetall(self._key('nodes')).items():
+            if node_id != self.node_id and now - float(last_seen) > stale_after:
+                self.purge_node(node_id)
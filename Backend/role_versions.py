@@ -0,0 +1,32 @@
+"""Role-version bookkeeping for JWT role claims.
+
+Tokens carry ``role`` and ``rv`` (role version) claims. A user's version only
+moves when their role changes, so the cache holds just those users; a token
+whose ``rv`` is behind the cached version is stale and the caller falls back
+to the database.
+"""
+
+
+class RoleVersionCache:
+    def __init__(self, backend, loader=None, key='auth:role_versions'):
+        self.backend = backend
+        self.key = key
+        self._loader = loader
+        self._loaded = loader is None
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            for user_id, version in self._loader():
+                self.backend.hset(self.key, {str(user_id): str(version)})
+            self._loaded = True
+
+    def current(self, user_id):
+        self._ensure_loaded()
+        version = self.backend.hget(self.key, str(user_id))
+        return int(version) if version is not None else 0
+
+    def is_current(self, user_id, claimed_version):
+        return int(claimed_version or 0) >= self.current(user_id)
+
+    def bump(self, user_id, version):
+        self.backend.hset(self.key, {str(user_id): str(version)})
@@ -0,0 +1,84 @@
+"""Recent ticket-room events kept for replay when a socket rejoins.
+
+Each buffered event carries the room's sequence number (``room_seq``, the id
+of the chat_messages row it stands for), so a client that rejoins with the
+last ``room_seq`` it saw can be sent only the gap. Every room keeps at most
+``capacity`` events, and at most ``max_rooms`` rooms are kept (least recently
+used go first). ``floor`` is the newest seq the room's buffer no longer
+holds (or its first event, for a buffer that started mid-stream): any
+``last_seq`` at or after it can be served from memory, anything older has
+to come from the database.
+"""
+import bisect
+import threading
+from collections import OrderedDict, deque
+
+
+class RoomEventBuffer:
+    def __init__(self, capacity=200, max_rooms=10000):
+        self.capacity = capacity
+        self.max_rooms = max_rooms
+        self._rooms = OrderedDict()
+        self._lock = threading.Lock()
+        self.replays = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def record(self, room, seq, event, data):
+        room = str(room)
+        with self._lock:
+            entry = self._rooms.get(room)
+            if entry is None:
+                entry = self._rooms[room] = {'events': deque(), 'floor': seq}
+                while len(self._rooms) > self.max_rooms:
+                    self._rooms.popitem(last=False)
+                    self.evictions += 1
+            self._rooms.move_to_end(room)
+            events = entry['events']
+            if events and seq <= events[-1][0]:
+                # Arrived out of order (another worker's event); keep seq order
+                seqs = [item[0] for item in events]
+                position = bisect.bisect_left(seqs, seq)
+                if position < len(seqs) and seqs[position] == seq:
+                    return
+                if position == 0 and seq < entry['floor']:
+                    return
+                events.insert(position, (seq, event, data))
+            else:
+                events.append((seq, event, data))
+            while len(events) > self.capacity:
+                entry['floor'] = events.popleft()[0]
+
+    def since(self, room, last_seq):
+        """Buffered ``(seq, event, data)`` after ``last_seq``, or None if the buffer has a gap there."""
+        with self._lock:
+            entry = self._rooms.get(str(room))
+            if entry is None or last_seq < entry['floor']:
+                self.misses += 1
+                return None
+            self.replays += 1
+            return [item for item in entry['events'] if item[0] > last_seq]
+
+    def latest(self, room):
+        with self._lock:
+            entry = self._rooms.get(str(room))
+            return entry['events'][-1][0] if entry and entry['events'] else None
+
+    def drop(self, room):
+        """Forget a room whose events changed outside ``record``; its next replay hits the database."""
+        with self._lock:
+            self._rooms.pop(str(room), None)
+
+    def stats(self):
+        with self._lock:
+            rooms = len(self._rooms)
+            events = sum(len(entry['events']) for entry in self._rooms.values())
+        return {
+            'rooms': rooms,
+            'events': events,
+            'capacity': self.capacity,
+            'max_rooms': self.max_rooms,
+            'replays': self.replays,
+            'database_fallbacks': self.misses,
+            'evictions': self.evictions
+        }
@@ -0,0 +1,103 @@
+"""In-process full-text index over ticket and chat text.
+
+Used when the database has no native full-text search (SQLite, tests). Every
+document (a ticket's category + description, or one chat message) is
+tokenized once when it is written; queries match documents containing every
+query term, like Postgres' ``plainto_tsquery``, and rank them with BM25.
+"""
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+STOPWORDS = frozenset(
+    'a an and are as at be but by for from has have i in is it its me my no not of on or '
+    'our so that the their this to was we were what when which will with you your'.split()
+)
+
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall((text or '').lower()) if t not in STOPWORDS]
+
+
+class SearchIndex:
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._postings = defaultdict(dict)   # term -> {doc_key: term frequency}
+        self._doc_len = {}                   # doc_key -> token count
+        self._doc_ticket = {}                # doc_key -> ticket id
+        self._total_len = 0
+        self._lock = threading.Lock()
+
+    # Tickets are keyed by negative id so they never collide with message ids
+    def add_ticket(self, ticket_id, category, description):
+        self._add(-int(ticket_id), int(ticket_id), f'{category} {description}')
+
+    def add_message(self, ticket_id, message_id, text):
+        self._add(int(message_id), int(ticket_id), text)
+
+    def _add(self, doc_key, ticket_id, text):
+        counts = Counter(tokenize(text))
+        with self._lock:
+            if doc_key in self._doc_len:
+                return
+            for term, tf in counts.items():
+                self._postings[term][doc_key] = tf
+            length = sum(counts.values())
+            self._doc_len[doc_key] = length
+            self._doc_ticket[doc_key] = ticket_id
+            self._total_len += length
+
+    def __len__(self):
+        return len(self._doc_len)
+
+    def search(self, query, visible, limit=20, batch_size=500):
+        """Rank tickets by the summed BM25 score of their matching documents.
+
+        ``visible(ticket_ids)`` returns the subset the caller may see; it is
+        called with the ranked candidates ``batch_size`` at a time, so one
+        lookup usually covers the whole page.
+
+        Returns ``[(ticket_id, score, [matching message ids])]``, best first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        with self._lock:
+            postings = [self._postings.get(term, {}) for term in terms]
+            if not all(postings):
+                return []
+            postings.sort(key=len)
+            docs = set(postings[0]).intersection(*postings[1:])
+            n_docs = len(self._doc_len)
+            avg_len = self._total_len / n_docs if n_docs else 0
+            scores = defaultdict(float)
+            messages = defaultdict(list)
+            for doc_key in docs:
+                length = self._doc_len[doc_key]
+                score = 0.0
+                for posting in postings:
+                    tf = posting[doc_key]
+                    idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+                    score += idf * tf * (self.K1 + 1) / (
+                        tf + self.K1 * (1 - self.B + self.B * length / avg_len))
+                ticket_id = self._doc_ticket[doc_key]
+                scores[ticket_id] += score
+                if doc_key > 0:
+                    messages[ticket_id].append((score, doc_key))
+
+        ranked = sorted(scores.items(), key=lambda item: -item[1])
+        results = []
+        for start in range(0, len(ranked), batch_size):
+            candidates = ranked[start:start + batch_size]
+            allowed = visible([ticket_id for ticket_id, _ in candidates])
+            for ticket_id, score in candidates:
+                if ticket_id in allowed:
+                    best = [doc_key for _, doc_key in sorted(messages[ticket_id], reverse=True)[:3]]
+                    results.append((ticket_id, score, best))
+                    if len(results) >= limit:
+                        return results
+        return results
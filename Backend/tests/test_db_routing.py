@@ -0,0 +1,144 @@
+import pytest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import insert, select
+
+from db_routing import ReplicaRouter, RoutingSession
+from pubsub import InProcessBackend
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_app(tmp_path, replica_paths, writer=None):
+    """A Flask-SQLAlchemy app on a primary SQLite file plus one bind per replica file.
+
+    Every database holds one row naming itself, so a read shows where it went.
+    """
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'primary.db'}"
+    app.config['SQLALCHEMY_BINDS'] = {
+        f'replica_{n}': f'sqlite:///{path}' for n, path in enumerate(replica_paths)
+    }
+    clock = Clock()
+    router = ReplicaRouter(InProcessBackend(), sorted(app.config['SQLALCHEMY_BINDS']),
+                           writer=writer, sticky_window=5, retry_after=30, clock=clock)
+    db = SQLAlchemy(session_options={'class_': RoutingSession, 'router': router})
+
+    class Item(db.Model):
+        id = db.Column(db.Integer, primary_key=True)
+        source = db.Column(db.String(20), nullable=False)
+
+    db.init_app(app)
+    with app.app_context():
+        engines = {'primary': db.engine}
+        for name in app.config['SQLALCHEMY_BINDS']:
+            engines[name] = db.engines[name]
+        for name, engine in engines.items():
+            try:
+                db.metadata.create_all(engine)
+                with engine.begin() as conn:
+                    conn.execute(insert(Item.__table__).values(source=name))
+            except Exception:
+                # An unreachable replica stays unreachable
+                pass
+    return app, db, Item, router, clock
+
+
+def sources(db, Item):
+    return db.session.execute(select(Item.source)).scalars().all()
+
+
+@pytest.fixture
+def replicated(tmp_path):
+    return make_app(tmp_path, [tmp_path / 'replica.db'], writer=lambda: 7)
+
+
+def test_reads_stay_on_primary_unless_routed(replicated):
+    app, db, Item, router, clock = replicated
+    with app.app_context():
+        assert sources(db, Item) == ['primary']
+
+
+def test_routed_reads_go_to_a_replica(replicated):
+    app, db, Item, router, clock = replicated
+    with app.app_context():
+        assert db.session().route_reads(1) == 'replica_0'
+        assert sources(db, Item) == ['replica_0']
+        assert router.stats['replica_sessions'] == 1
+
+
+def test_writes_and_locking_reads_use_the_primary(replicated):
+    app, db, Item, router, clock = replicated
+    with app.app_context():
+        db.session().route_reads(1)
+        locked = db.session.execute(select(Item.source).with_for_update()).scalars().all()
+        assert locked == ['primary']
+        assert sources(db, Item) == ['replica_0']
+
+        db.session.add(Item(source='new'))
+        db.session.flush()
+        # After its first write the session reads its own writes
+        assert sources(db, Item) == ['primary', 'new']
+        assert db.session().route_reads(1) is None
+        db.session.rollback()
+
+
+def test_commit_pins_the_writer_to_the_primary(replicated):
+    app, db, Item, router, clock = replicated
+    with app.app_context():
+        db.session.add(Item(source='new'))
+        db.session.commit()
+        assert router.is_sticky(7)
+
+    with app.app_context():
+        assert db.session().route_reads(7) is None
+        assert sources(db, Item) == ['primary', 'new']
+        assert router.stats['sticky_sessions'] == 1
+
+    clock.now += 6
+    with app.app_context():
+        assert db.session().route_reads(7) == 'replica_0'
+        assert sources(db, Item) == ['replica_0']
+    assert not router.is_sticky(7)
+
+
+def test_rollback_does_not_pin_the_writer(replicated):
+    app, db, Item, router, clock = replicated
+    with app.app_context():
+        db.session.add(Item(source='new'))
+        db.session.flush()
+        db.session.rollback()
+        assert not router.is_sticky(7)
+
+
+def test_unreachable_replica_falls_back_to_the_primary(tmp_path):
+    app, db, Item, router, clock = make_app(tmp_path, [tmp_path / 'missing' / 'replica.db'])
+    with app.app_context():
+        db.session().route_reads(1)
+        assert sources(db, Item) == ['primary']
+    assert router.health() == {'replica_0': False}
+    assert router.stats['replica_errors'] == 1
+    assert router.stats['primary_fallbacks'] == 1
+
+    # Skipped until retry_after has passed
+    with app.app_context():
+        assert db.session().route_reads(1) is None
+    clock.now += 31
+    assert router.health() == {'replica_0': True}
+
+
+def test_replicas_take_turns_and_skip_a_down_one(tmp_path):
+    app, db, Item, router, clock = make_app(
+        tmp_path, [tmp_path / 'replica_a.db', tmp_path / 'replica_b.db'])
+    with app.app_context():
+        assert [router.pick() for _ in range(4)] == ['replica_0', 'replica_1'] * 2
+        router.mark_down('replica_0')
+        assert [router.pick() for _ in range(2)] == ['replica_1'] * 2
+        router.mark_down('replica_1')
+        assert router.pick() is None
@@ -0,0 +1,79 @@
+from deadline_wheel import DeadlineScheduler, TimingWheel
+
+
+def test_advance_returns_only_due_keys():
+    wheel = TimingWheel(tick=1.0, slots=8, start=100)
+    wheel.schedule('a', 101.5)
+    wheel.schedule('b', 103.0)
+
+    assert wheel.advance(101.0) == []
+    assert wheel.advance(101.5) == ['a']
+    assert 'a' not in wheel
+    assert wheel.advance(102.9) == []
+    assert wheel.advance(103.0) == ['b']
+    assert len(wheel) == 0
+
+
+def test_key_due_later_in_the_current_tick_waits():
+    wheel = TimingWheel(tick=1.0, slots=8, start=100)
+    wheel.schedule('a', 100.8)
+
+    assert wheel.advance(100.2) == []
+    assert wheel.advance(100.8) == ['a']
+
+
+def test_reschedule_and_cancel():
+    wheel = TimingWheel(tick=1.0, slots=8, start=100)
+    wheel.schedule('a', 101)
+    wheel.schedule('a', 105)
+    wheel.schedule('b', 102)
+    wheel.cancel('b')
+    wheel.cancel('missing')
+
+    assert wheel.deadline('a') == 105
+    assert wheel.advance(104) == []
+    assert wheel.advance(105) == ['a']
+
+
+def test_overdue_key_expires_on_next_advance():
+    wheel = TimingWheel(tick=1.0, slots=8, start=100)
+    wheel.advance(110)
+    wheel.schedule('late', 90)
+
+    assert wheel.advance(110.5) == ['late']
+
+
+def test_deadline_beyond_one_revolution_is_not_expired_early():
+    wheel = TimingWheel(tick=1.0, slots=8, start=100)
+    # Lands in the same slot as 101, one revolution later
+    wheel.schedule('far', 109)
+
+    assert wheel.advance(101) == []
+    assert wheel.advance(108) == []
+    assert wheel.advance(109) == ['far']
+
+
+def test_long_gap_visits_every_slot_once():
+    wheel = TimingWheel(tick=1.0, slots=8, start=100)
+    for i in range(20):
+        wheel.schedule(i, 101 + i)
+
+    assert sorted(wheel.advance(1000)) == list(range(20))
+    assert len(wheel) == 0
+
+
+def test_scheduler_batches_expired_keys_and_survives_errors():
+    wheel = TimingWheel(tick=1.0, slots=8, start=100)
+    for i in range(5):
+        wheel.schedule(i, 100.5)
+    batches = []
+
+    def on_expired(batch):
+        batches.append(sorted(batch))
+        if len(batches) == 1:
+            raise RuntimeError('database down')
+
+    scheduler = DeadlineScheduler(wheel, on_expired, clock=lambda: 101, batch_size=2)
+    assert sorted(scheduler.run_once()) == list(range(5))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert scheduler.stats == {'ticks': 1, 'expired': 3, 'batches': 2, 'errors': 1}
@@ -0,0 +1,151 @@
+import threading
+import time
+
+import fakeredis
+import pytest
+import redis
+
+from pubsub import (
+    BackendManager, InProcessBackend, PresenceRegistry, RedisBackend,
+    create_backend, create_client_manager
+)
+
+
+@pytest.fixture
+def redis_server(monkeypatch):
+    """Every RedisBackend built during the test talks to one in-memory server."""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis.Redis, 'from_url', classmethod(
+        lambda cls, url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs)))
+    return server
+
+
+@pytest.fixture(params=['memory', 'redis'])
+def backend(request):
+    if request.param == 'memory':
+        return InProcessBackend()
+    request.getfixturevalue('redis_server')
+    return RedisBackend('redis://localhost:6379/0')
+
+
+def test_create_backend_picks_by_url(redis_server):
+    assert isinstance(create_backend(None), InProcessBackend)
+    assert isinstance(create_backend('memory://'), InProcessBackend)
+    assert isinstance(create_backend('redis://localhost:6379/0'), RedisBackend)
+    with pytest.raises(ValueError):
+        create_backend('amqp://localhost')
+
+
+def test_client_manager_only_for_shared_backends(redis_server):
+    assert create_client_manager(InProcessBackend()) is None
+    assert isinstance(create_client_manager(RedisBackend('redis://localhost')), BackendManager)
+
+
+def test_connect_join_and_lookup(backend):
+    registry = PresenceRegistry(backend, node_id='node-a')
+    registry.connect('sid1', 7, role='member', codec='json')
+    registry.join('sid1', '42')
+
+    assert 'sid1' in registry
+    assert len(registry) == 1
+    assert registry.user_id('sid1') == '7'
+    assert registry.attr('sid1', 'role') == 'member'
+    assert registry['sid1']['rooms'] == {'42'}
+    assert registry.in_room('sid1', 42)
+    assert registry.room_users('42') == {'7'}
+    assert registry.room_size('42') == 1
+    assert registry.room_sizes('42', '42#msgpack') == [1, 0]
+    assert registry.room_count() == 1
+    assert registry.is_online(7)
+    assert registry.get('missing') is None
+    with pytest.raises(KeyError):
+        registry['missing']
+
+
+def test_leave_and_disconnect_clean_up(backend):
+    registry = PresenceRegistry(backend, node_id='node-a')
+    registry.connect('sid1', 7)
+    registry.connect('sid2', 7)
+    registry.join('sid1', '42')
+    registry.join('sid1', '43')
+
+    registry.leave('sid1', '43')
+    assert registry.rooms('sid1') == {'42'}
+    assert registry.room_count() == 1
+
+    assert registry.disconnect('sid1') == {'42'}
+    assert 'sid1' not in registry
+    assert registry.room_count() == 0
+    # The user still has another socket
+    assert registry.is_online(7)
+
+    registry.disconnect('sid2')
+    assert not registry.is_online(7)
+    assert len(registry) == 0
+
+
+def test_workers_share_presence(redis_server):
+    worker_a = PresenceRegistry(RedisBackend('redis://localhost'), node_id='node-a')
+    worker_b = PresenceRegistry(RedisBackend('redis://localhost'), node_id='node-b')
+    worker_a.connect('sid1', 7)
+    worker_a.join('sid1', '42')
+    worker_b.connect('sid2', 8)
+    worker_b.join('sid2', '42')
+
+    assert 'sid1' in worker_b
+    assert worker_b.room_users('42') == {'7', '8'}
+    assert worker_a.online_users() == {'7', '8'}
+
+
+def test_reap_purges_stale_nodes(redis_server):
+    worker_a = PresenceRegistry(RedisBackend('redis://localhost'), node_id='node-a')
+    worker_b = PresenceRegistry(RedisBackend('redis://localhost'), node_id='node-b')
+    worker_a.connect('sid1', 7)
+    worker_a.join('sid1', '42')
+    worker_b.connect('sid2', 8)
+    worker_a.heartbeat()
+    worker_b.heartbeat()
+
+    worker_b.reap(stale_after=60)
+    assert 'sid1' in worker_b
+
+    worker_a.backend.hset('presence:nodes', {'node-a': str(time.time() - 120)})
+    worker_b.reap(stale_after=60)
+    assert 'sid1' not in worker_b
+    assert worker_b.room_count() == 0
+    assert worker_b.online_users() == {'8'}
+    # A node never reaps itself
+    worker_b.backend.hset('presence:nodes', {'node-b': str(time.time() - 120)})
+    worker_b.reap(stale_after=60)
+    assert 'sid2' in worker_b
+
+
+def _subscribed(backend, channel):
+    if isinstance(backend, RedisBackend):
+        return backend._pubsub_client.pubsub_numsub(channel)[0][1] > 0
+    return bool(backend._subscribers[channel])
+
+
+def _next_message(backend, channel, publisher, data):
+    """Subscribe in a thread, publish once subscribed and return what arrived."""
+    messages = backend.listen(channel)
+    received = []
+    listener = threading.Thread(target=lambda: received.append(next(messages)), daemon=True)
+    listener.start()
+    deadline = time.monotonic() + 2
+    while not _subscribed(backend, channel) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    publisher.publish(channel, data)
+    listener.join(timeout=2)
+    return received
+
+
+def test_publish_reaches_other_workers(redis_server):
+    subscriber = RedisBackend('redis://localhost')
+    publisher = RedisBackend('redis://localhost')
+    assert _next_message(subscriber, 'ticket_state', publisher, b'node-b|42') == [b'node-b|42']
+
+
+def test_publish_in_process():
+    backend = InProcessBackend()
+    assert _next_message(backend, 'ticket_state', backend, b'node-a|42') == [b'node-a|42']
@@ -0,0 +1,69 @@
+from room_events import RoomEventBuffer
+
+
+def seqs(events):
+    return [seq for seq, event, data in events]
+
+
+def test_since_returns_the_gap():
+    buffer = RoomEventBuffer(capacity=10)
+    for seq in (5, 6, 8):
+        buffer.record(42, seq, 'message', {'id': seq})
+
+    assert seqs(buffer.since(42, 5)) == [6, 8]
+    assert buffer.since('42', 8) == []
+    assert buffer.latest(42) == 8
+
+
+def test_out_of_order_and_duplicate_events_keep_seq_order():
+    buffer = RoomEventBuffer(capacity=10)
+    for seq in (5, 8, 6, 8, 7):
+        buffer.record(42, seq, 'message', {})
+
+    assert seqs(buffer.since(42, 5)) == [6, 7, 8]
+
+
+def test_floor_moves_as_events_roll_off():
+    buffer = RoomEventBuffer(capacity=2)
+    for seq in (1, 2, 3, 4):
+        buffer.record(42, seq, 'message', {})
+
+    # 1 and 2 are gone: only a client that saw 2 or later can be served
+    assert buffer.since(42, 1) is None
+    assert seqs(buffer.since(42, 2)) == [3, 4]
+    # Older than anything kept is dropped rather than misreported
+    buffer.record(42, 1, 'message', {})
+    assert seqs(buffer.since(42, 2)) == [3, 4]
+    assert buffer.stats()['database_fallbacks'] == 1
+    assert buffer.stats()['replays'] == 2
+
+
+def test_buffer_started_mid_stream_cannot_serve_earlier_seqs():
+    buffer = RoomEventBuffer()
+    buffer.record(42, 10, 'ticket_closed', {})
+
+    assert buffer.since(42, 9) is None
+    assert seqs(buffer.since(42, 10)) == []
+    assert buffer.since(43, 0) is None
+
+
+def test_least_recently_used_rooms_are_evicted():
+    buffer = RoomEventBuffer(max_rooms=2)
+    buffer.record(1, 1, 'message', {})
+    buffer.record(2, 2, 'message', {})
+    buffer.record(1, 3, 'message', {})
+    buffer.record(3, 4, 'message', {})
+
+    assert buffer.latest(2) is None
+    assert buffer.latest(1) == 3
+    assert buffer.stats()['rooms'] == 2
+    assert buffer.stats()['evictions'] == 1
+
+
+def test_drop_forgets_a_room():
+    buffer = RoomEventBuffer()
+    buffer.record(42, 1, 'message', {})
+    buffer.drop(42)
+
+    assert buffer.since(42, 1) is None
+    assert buffer.stats()['events'] == 0
@@ -0,0 +1,103 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+
+BACKEND = os.path.join(os.path.dirname(__file__), '..')
+
+# Tables as the first release created them
+BASELINE_SCHEMA = """
+CREATE TABLE users (
+    id INTEGER NOT NULL PRIMARY KEY,
+    first_name VARCHAR(50) NOT NULL,
+    last_name VARCHAR(50) NOT NULL,
+    dob DATE,
+    email VARCHAR(120) NOT NULL UNIQUE,
+    phone VARCHAR(15) NOT NULL UNIQUE,
+    password VARCHAR(255) NOT NULL,
+    role VARCHAR(20) NOT NULL
+);
+CREATE TABLE tickets (
+    id INTEGER NOT NULL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    category VARCHAR(50) NOT NULL,
+    urgency VARCHAR(20) NOT NULL,
+    description TEXT NOT NULL,
+    predefined_question VARCHAR(255),
+    visibility VARCHAR(20) NOT NULL,
+    created_by INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    assigned_to INTEGER REFERENCES users (id),
+    created_at DATETIME NOT NULL,
+    closure_reason TEXT,
+    reassigned_to INTEGER REFERENCES users (id),
+    last_message_at DATETIME
+);
+CREATE TABLE chat_messages (
+    id INTEGER NOT NULL PRIMARY KEY,
+    ticket_id INTEGER NOT NULL REFERENCES tickets (id),
+    sender_id INTEGER NOT NULL REFERENCES users (id),
+    message TEXT NOT NULL,
+    timestamp DATETIME NOT NULL,
+    is_system BOOLEAN
+);
+INSERT INTO users VALUES (1, 'a', 'b', '2000-01-01', 'u@x.com', '1', 'x', 'user');
+INSERT INTO users VALUES (2, 'c', 'd', '2000-01-01', 'm@x.com', '2', 'x', 'member');
+INSERT INTO tickets (id, user_id, category, urgency, description, visibility, created_by,
+                     status, assigned_to, created_at, last_message_at)
+VALUES (1, 1, 'network', 'Low', 'drops', 'all_members', 1, 'assigned', 2,
+        '2024-01-01 00:00:00', '2024-01-01 00:00:00');
+INSERT INTO chat_messages VALUES (1, 1, 2, 'hello', '2024-01-01 00:00:00', 0);
+"""
+
+# Runs in a child process: importing app monkey-patches the interpreter with eventlet
+UPGRADE_SCRIPT = """
+import json
+from datetime import datetime
+from sqlalchemy import inspect
+import app as appmod
+
+with appmod.app.app_context():
+    appmod.db.create_all(bind_key=None)
+    appmod.upgrade_schema()
+    appmod.upgrade_schema()
+    schema = inspect(appmod.db.engine)
+    result = {
+        'sender_nullable': {c['name']: c['nullable'] for c in schema.get_columns('chat_messages')}['sender_id'],
+        'users': [c['name'] for c in schema.get_columns('users')],
+        'tickets': [c['name'] for c in schema.get_columns('tickets')],
+        'indexes': sorted(i['name'] for i in schema.get_indexes('chat_messages')),
+    }
+closed = appmod.close_inactive_tickets(datetime.now(appmod.IST), 'test')
+with appmod.app.app_context():
+    result['closed'] = closed
+    result['messages'] = [
+        (m.sender_id, m.message, m.is_system)
+        for m in appmod.ChatMessage.query.order_by(appmod.ChatMessage.id)
+    ]
+print(json.dumps(result))
+"""
+
+
+def test_upgrade_from_baseline_schema(tmp_path):
+    database = tmp_path / 'baseline.db'
+    with sqlite3.connect(database) as conn:
+        conn.executescript(BASELINE_SCHEMA)
+
+    env = {**os.environ, 'DATABASE_URL': f'sqlite:///{database}'}
+    env.pop('SOCKETIO_MESSAGE_QUEUE', None)
+    env.pop('REPLICA_DATABASE_URLS', None)
+    out = subprocess.run([sys.executable, '-c', UPGRADE_SCRIPT], cwd=BACKEND, env=env,
+                         check=True, capture_output=True, text=True).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+
+    assert result['sender_nullable'] is True
+    assert 'role_version' in result['users']
+    assert {'updated_at', 'archived_at'} <= set(result['tickets'])
+    assert result['indexes'] == ['ix_chat_messages_ticket_id_id']
+    # System messages (sender_id NULL) can be written after the upgrade
+    assert result['closed'] == [1]
+    assert result['messages'][0] == [2, 'hello', False]
+    assert result['messages'][1][0] is None
+    assert result['messages'][1][2] is True
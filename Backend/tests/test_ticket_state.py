@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from ticket_state import CONFLICT, FORBIDDEN, INVALID_STATE, NOT_FOUND, TicketStateMachine
+
+metadata = MetaData()
+tickets = Table(
+    'tickets', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('status', String(20), nullable=False),
+    Column('assigned_to', Integer),
+    Column('closure_reason', String(200)),
+)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    metadata.create_all(engine)
+    with Session(engine) as session:
+        session.execute(insert(tickets), [
+            {'id': 1, 'status': 'open', 'assigned_to': None},
+            {'id': 2, 'status': 'open', 'assigned_to': None},
+            {'id': 3, 'status': 'assigned', 'assigned_to': 10},
+            {'id': 4, 'status': 'assigned', 'assigned_to': 11},
+            {'id': 5, 'status': 'closed', 'assigned_to': 10},
+        ])
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def machine():
+    return TicketStateMachine(tickets)
+
+
+def statuses(session):
+    return dict(session.execute(select(tickets.c.id, tickets.c.status)).all())
+
+
+def test_apply_moves_a_ticket(session, machine):
+    result = machine.apply(session, 'accept', 1, values={'assigned_to': 10})
+    assert result
+    assert (result.row.status, result.row.assigned_to) == ('assigned', 10)
+
+
+def test_apply_reports_why_nothing_moved(session, machine):
+    assert machine.apply(session, 'accept', 99).reason == NOT_FOUND
+    assert machine.apply(session, 'accept', 3).reason == INVALID_STATE
+    assert machine.apply(session, 'close', 4, guard={'assigned_to': 10}).reason == FORBIDDEN
+    conflict = machine.apply(session, 'close', 3, where=[tickets.c.closure_reason.isnot(None)])
+    assert conflict.reason == CONFLICT
+    assert conflict.current.status == 'assigned'
+
+
+def test_apply_many_updates_matching_rows_only(session, machine):
+    rows, failures = machine.apply_many(
+        session, 'close', [3, 4, 5, 99, 3],
+        values={'closure_reason': 'done'}, guard={'assigned_to': 10})
+
+    assert [(row.id, row.status, row.closure_reason) for row in rows] == [(3, 'closed', 'done')]
+    assert failures == {4: FORBIDDEN, 5: INVALID_STATE, 99: NOT_FOUND}
+    assert statuses(session) == {1: 'open', 2: 'open', 3: 'closed', 4: 'assigned', 5: 'closed'}
+
+
+def test_apply_many_chunks_large_id_lists(session, machine):
+    rows, failures = machine.apply_many(session, 'reject', [1, 2, 3], chunk_size=1)
+
+    assert sorted(row.id for row in rows) == [1, 2]
+    assert failures == {3: INVALID_STATE}
+
+
+def test_apply_many_with_nothing_to_move(session, machine):
+    rows, failures = machine.apply_many(session, 'reopen', [1, 99])
+
+    assert rows == []
+    assert failures == {1: INVALID_STATE, 99: NOT_FOUND}
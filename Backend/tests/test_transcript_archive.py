@@ -0,0 +1,59 @@
+import pytest
+
+from transcript_archive import ArchiveMissingError, TranscriptArchive
+
+
+def message(message_id, text):
+    return {'id': message_id, 'sender_id': 1, 'message': text,
+            'timestamp': '2024-01-01T00:00:00', 'is_system': False}
+
+
+def test_read_round_trip(tmp_path):
+    archive = TranscriptArchive(str(tmp_path))
+    archive.append_many({1: [message(1, 'hi'), message(2, 'bye')], 2: [message(3, 'x')]})
+
+    assert [msg['message'] for msg in archive.read(1)] == ['hi', 'bye']
+    assert archive.read(3) is None
+    assert archive.stats()['transcripts'] == 2
+
+
+def test_empty_transcript_is_indexed_without_a_record(tmp_path):
+    archive = TranscriptArchive(str(tmp_path))
+    archive.append_many({1: []})
+
+    assert archive.read(1) == []
+    assert archive.read_required(1) == []
+    assert 1 in archive
+    assert archive.stats() == {'transcripts': 1, 'segments': 0, 'bytes': 0}
+
+
+def test_read_required_raises_for_a_missing_record(tmp_path):
+    archive = TranscriptArchive(str(tmp_path))
+
+    with pytest.raises(ArchiveMissingError):
+        archive.read_required(1)
+
+
+def test_reader_sees_a_transcript_archived_again_by_another_worker(tmp_path):
+    reader = TranscriptArchive(str(tmp_path))
+    writer = TranscriptArchive(str(tmp_path))
+    writer.append_many({1: [message(1, 'first period')]})
+    assert [msg['message'] for msg in reader.read(1)] == ['first period']
+
+    # Reopened, used, closed and archived again, all on the other worker
+    writer.remove(1)
+    writer.append_many({1: [message(1, 'first period'), message(2, 'second period')]})
+
+    assert [msg['message'] for msg in reader.read(1)] == ['first period', 'second period']
+
+
+def test_reader_sees_a_removal_by_another_worker(tmp_path):
+    reader = TranscriptArchive(str(tmp_path))
+    writer = TranscriptArchive(str(tmp_path))
+    writer.append_many({1: [message(1, 'hi')]})
+    assert reader.read(1)
+
+    writer.remove(1)
+
+    assert reader.read(1) is None
+    assert 1 not in reader
@@ -0,0 +1,68 @@
+"""Bounded LRU cache of ticket state for the socket hot paths.
+
+Only the fields the handlers need to authorize and gate a message are kept
+(status, user_id, assigned_to). Every write path must ``update`` or
+``invalidate`` the entry after its commit.
+"""
+import threading
+from collections import OrderedDict
+
+
+class TicketStateCache:
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, ticket_id, loader=None):
+        """Return the cached state, loading it with ``loader(ticket_id)`` on a miss."""
+        key = int(ticket_id)
+        with self._lock:
+            state = self._entries.get(key)
+            if state is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return state
+            self.misses += 1
+        if loader is None:
+            return None
+        state = loader(key)
+        if state is not None:
+            self.put(key, state)
+        return state
+
+    def put(self, ticket_id, state):
+        key = int(ticket_id)
+        with self._lock:
+            self._entries[key] = state
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def update(self, ticket):
+        self.put(ticket.id, {
+            'status': ticket.status,
+            'user_id': ticket.user_id,
+            'assigned_to': ticket.assigned_to
+        })
+
+    def invalidate(self, ticket_id):
+        with self._lock:
+            self._entries.pop(int(ticket_id), None)
+
+    def stats(self):
+        with self._lock:
+            size = len(self._entries)
+        lookups = self.hits + self.misses
+        return {
+            'size': size,
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,103 @@
+"""Automatic assignment of open tickets to members.
+
+Open tickets wait in a priority queue ordered by urgency, then age. Each
+``assign_pending`` pass hands the most urgent ticket to the online member with
+the fewest open assigned tickets, until the queue is empty or every online
+member is at ``max_load``. The ``assign`` callback performs the conditional
+database update, so a ticket accepted elsewhere in the meantime is skipped.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+URGENCY_RANK = {'high': 0, 'medium': 1, 'low': 2}
+
+
+class TicketRouter:
+    def __init__(self, assign, online_members, load_of, max_load=5, interval=5, sleep=time.sleep):
+        self._assign = assign
+        self._online_members = online_members
+        self._load_of = load_of
+        self.max_load = max_load
+        self.interval = interval
+        self._sleep = sleep
+        self._heap = []
+        self._queued = {}
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self.stats = {'assigned': 0, 'skipped': 0, 'passes': 0, 'errors': 0}
+
+    def enqueue(self, ticket_id, urgency, created_at):
+        ticket_id = int(ticket_id)
+        key = (URGENCY_RANK.get((urgency or '').lower(), len(URGENCY_RANK)), created_at, next(self._order))
+        with self._lock:
+            self._queued[ticket_id] = key
+            heapq.heappush(self._heap, (key, ticket_id))
+
+    def remove(self, ticket_id):
+        # Lazy delete; the stale heap entry is dropped when it surfaces
+        with self._lock:
+            self._queued.pop(int(ticket_id), None)
+
+    def __contains__(self, ticket_id):
+        return int(ticket_id) in self._queued
+
+    def __len__(self):
+        return len(self._queued)
+
+    def _pop(self):
+        while self._heap:
+            key, ticket_id = heapq.heappop(self._heap)
+            if self._queued.get(ticket_id) == key:
+                del self._queued[ticket_id]
+                return key, ticket_id
+        return None
+
+    def _pick_member(self):
+        candidates = [
+            (self._load_of(member_id), member_id) for member_id in self._online_members()
+        ]
+        candidates = [c for c in candidates if c[0] < self.max_load]
+        return min(candidates)[1] if candidates else None
+
+    def assign_pending(self):
+        """Assign queued tickets while capacity lasts; return ``[(ticket_id, member_id)]``."""
+        assigned = []
+        self.stats['passes'] += 1
+        while True:
+            member_id = self._pick_member()
+            if member_id is None:
+                break
+            with self._lock:
+                entry = self._pop()
+            if entry is None:
+                break
+            key, ticket_id = entry
+            try:
+                ok = self._assign(ticket_id, member_id)
+            except Exception as e:
+                # Put it back and retry on the next pass
+                self.stats['errors'] += 1
+                logger.error(f"Error assigning ticket {ticket_id} to member {member_id}: {str(e)}")
+                with self._lock:
+                    if ticket_id not in self._queued:
+                        self._queued[ticket_id] = key
+                        heapq.heappush(self._heap, (key, ticket_id))
+                break
+            if ok:
+                self.stats['assigned'] += 1
+                assigned.append((ticket_id, member_id))
+            else:
+                self.stats['skipped'] += 1
+        return assigned
+
+    def run_forever(self):
+        # Periodic pass picks up members coming online and capacity freed elsewhere
+        while True:
+            if self._queued:
+                self.assign_pending()
+            self._sleep(self.interval)
@@ -0,0 +1,116 @@
+"""Ticket state machine backed by conditional single-statement updates.
+
+Each transition is ``UPDATE tickets SET status=<target>, ... WHERE id=:id AND
+status=<source> [AND guards] RETURNING *``: the status check and the write
+happen atomically in the database, so two members accepting the same ticket
+cannot both win, and the happy path costs one round trip. Only when nothing
+matched is the row read back to say why.
+"""
+from sqlalchemy import select, update
+
+# action -> (source status, target status)
+TRANSITIONS = {
+    'accept': ('open', 'assigned'),
+    'reject': ('open', 'rejected'),
+    'close': ('assigned', 'closed'),
+    'reopen': ('closed', 'assigned'),
+    'reassign': ('assigned', 'assigned'),
+    'expire': ('assigned', 'closed'),
+}
+
+NOT_FOUND = 'not_found'
+FORBIDDEN = 'forbidden'
+INVALID_STATE = 'invalid_state'
+CONFLICT = 'conflict'
+
+
+class TransitionResult:
+    """Outcome of a transition: ``row`` on success, else ``reason`` and the ``current`` row."""
+
+    def __init__(self, action, row=None, reason=None, current=None):
+        self.action = action
+        self.row = row
+        self.reason = reason
+        self.current = current
+
+    @property
+    def ok(self):
+        return self.row is not None
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        if self.ok:
+            return f'<TransitionResult {self.action} ok id={self.row.id}>'
+        return f'<TransitionResult {self.action} {self.reason}>'
+
+
+class TicketStateMachine:
+    def __init__(self, table, transitions=TRANSITIONS):
+        self.table = table
+        self.transitions = transitions
+
+    def source(self, action):
+        return self.transitions[action][0]
+
+    def target(self, action):
+        return self.transitions[action][1]
+
+    def apply(self, session, action, ticket_id, values=None, guard=None, where=()):
+        """Run one transition inside the caller's transaction; the caller commits.
+
+        ``guard`` maps columns to required values (ownership checks) and is
+        reported as ``forbidden``; extra ``where`` clauses that fail are
+        reported as ``conflict``.
+        """
+        source, target = self.transitions[action]
+        guard = guard or {}
+        columns = self.table.c
+        row = session.execute(
+            update(self.table)
+            .where(columns.id == int(ticket_id), columns.status == source,
+                   *(columns[name] == value for name, value in guard.items()), *where)
+            .values(status=target, **(values or {}))
+            .returning(*columns)
+        ).first()
+        if row is not None:
+            return TransitionResult(action, row=row)
+
+        current = session.execute(select(self.table).where(columns.id == int(ticket_id))).first()
+        return TransitionResult(action, reason=self._reason(current, source, guard), current=current)
+
+    def apply_many(self, session, action, ticket_ids, values=None, guard=None, where=(), chunk_size=1000):
+        """Set-based ``apply``: returns ``(rows, {ticket_id: reason})`` for the ids that did not move."""
+        source, target = self.transitions[action]
+        guard = guard or {}
+        columns = self.table.c
+        ticket_ids = list(dict.fromkeys(int(ticket_id) for ticket_id in ticket_ids))
+        rows = []
+        for i in range(0, len(ticket_ids), chunk_size):
+            rows.extend(session.execute(
+                update(self.table)
+                .where(columns.id.in_(ticket_ids[i:i + chunk_size]), columns.status == source,
+                       *(columns[name] == value for name, value in guard.items()), *where)
+                .values(status=target, **(values or {}))
+                .returning(*columns)
+            ).all())
+
+        moved = {row.id for row in rows}
+        missed = [ticket_id for ticket_id in ticket_ids if ticket_id not in moved]
+        failures = dict.fromkeys(missed, NOT_FOUND)
+        for i in range(0, len(missed), chunk_size):
+            for current in session.execute(
+                    select(self.table).where(columns.id.in_(missed[i:i + chunk_size]))):
+                failures[current.id] = self._reason(current, source, guard)
+        return rows, failures
+
+    @staticmethod
+    def _reason(current, source, guard):
+        if current is None:
+            return NOT_FOUND
+        if any(getattr(current, name) != value for name, value in guard.items()):
+            return FORBIDDEN
+        if current.status != source:
+            return INVALID_STATE
+        return CONFLICT
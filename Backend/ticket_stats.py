@@ -0,0 +1,114 @@
+"""Running ticket analytics for the admin dashboard.
+
+Counters by status, urgency and category, per-member open load and
+time-to-accept / time-to-close histograms. Every ticket transition applies a
+``(before, after)`` delta, so reading the figures never touches the tickets
+table; ``load`` hydrates them once at startup.
+"""
+import bisect
+import threading
+from collections import Counter
+
+
+class LatencyHistogram:
+    """Fixed log-spaced buckets (10ms .. ~1 year); percentiles cost O(buckets)."""
+
+    def __init__(self, start=0.01, factor=1.25, buckets=100):
+        self.bounds = [start * factor ** i for i in range(buckets)]
+        self.counts = [0] * (buckets + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        seconds = max(seconds, 0.0)
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th quantile, or None if empty."""
+        if not self.total:
+            return None
+        rank = q * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return self.bounds[index] if index < len(self.bounds) else self.bounds[-1]
+        return self.bounds[-1]
+
+    def summary(self):
+        return {
+            'count': self.total,
+            'mean': self.sum / self.total if self.total else None,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95)
+        }
+
+
+class TicketStats:
+    DURATIONS = ('accept', 'close')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.by_status = Counter()
+        self.by_urgency = Counter()
+        self.by_category = Counter()
+        self.member_load = Counter()
+        self.durations = {name: LatencyHistogram() for name in self.DURATIONS}
+
+    @staticmethod
+    def snapshot(ticket):
+        return (ticket.status, ticket.urgency, ticket.category, ticket.assigned_to)
+
+    def _count(self, state, sign):
+        status, urgency, category, assigned_to = state
+        for counter, key in ((self.by_status, status),
+                             (self.by_urgency, urgency),
+                             (self.by_category, category)):
+            counter[key] += sign
+            if counter[key] <= 0:
+                del counter[key]
+        if status == 'assigned' and assigned_to is not None:
+            self.member_load[int(assigned_to)] += sign
+            if self.member_load[int(assigned_to)] <= 0:
+                del self.member_load[int(assigned_to)]
+
+    def apply(self, before, after, durations=None):
+        """Move one ticket from state ``before`` to ``after`` (either may be None)."""
+        with self._lock:
+            if before is not None:
+                self._count(before, -1)
+            if after is not None:
+                self._count(after, 1)
+            for name, seconds in (durations or {}).items():
+                self.durations[name].observe(seconds)
+
+    def load(self, groups, durations):
+        """Replace all figures from ``(status, urgency, category, assigned_to, count)``
+        rows and ``(name, seconds)`` pairs."""
+        with self._lock:
+            self._reset()
+            for status, urgency, category, assigned_to, count in groups:
+                self.by_status[status] += count
+                self.by_urgency[urgency] += count
+                self.by_category[category] += count
+                if status == 'assigned' and assigned_to is not None:
+                    self.member_load[int(assigned_to)] += count
+            for name, seconds in durations:
+                self.durations[name].observe(seconds)
+
+    def summary(self):
+        with self._lock:
+            return {
+                'total': sum(self.by_status.values()),
+                'by_status': dict(self.by_status),
+                'by_urgency': dict(self.by_urgency),
+                'by_category': dict(self.by_category),
+                'member_load': {str(member): load for member, load in self.member_load.items()},
+                'time_to_accept': self.durations['accept'].summary(),
+                'time_to_close': self.durations['close'].summary()
+            }
@@ -0,0 +1,166 @@
+"""Cold storage for closed-ticket chat transcripts.
+
+Transcripts are zlib-compressed JSON records appended to segment files
+(``segment-000001.dat``, ...). ``index.log`` is an append-only offset index:
+one ``ticket_id segment offset length`` line per record, ``ticket_id 0 0 0``
+for an empty transcript (no record is written), or ``ticket_id - 0 0`` once a
+transcript has been rehydrated back into the database. Reads slice the record
+straight out of a memory-mapped segment.
+"""
+import fcntl
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+# ticket_id, payload length, crc32 of the payload
+RECORD_HEADER = struct.Struct('>QII')
+
+
+class ArchiveCorruptError(Exception):
+    pass
+
+
+class ArchiveMissingError(Exception):
+    pass
+
+
+class TranscriptArchive:
+    def __init__(self, directory, segment_max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._index_path = os.path.join(directory, 'index.log')
+        self._index = {}
+        self._index_pos = 0
+        self._maps = {}
+        self._lock = threading.Lock()
+        self._refresh_index()
+
+    def _segment_path(self, segment):
+        return os.path.join(self.directory, f'segment-{segment:06d}.dat')
+
+    def _refresh_index(self):
+        """Apply index lines appended since the last read (possibly by another worker)."""
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, 'rb') as f:
+            f.seek(self._index_pos)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # partially written line; pick it up next time
+                self._index_pos += len(line)
+                ticket_id, segment, offset, length = line.split()
+                if segment == b'-':
+                    self._index.pop(int(ticket_id), None)
+                else:
+                    self._index[int(ticket_id)] = (int(segment), int(offset), int(length))
+
+    def _current_segment(self):
+        segments = sorted(
+            int(name[8:14]) for name in os.listdir(self.directory)
+            if name.startswith('segment-') and name.endswith('.dat')
+        )
+        segment = segments[-1] if segments else 1
+        path = self._segment_path(segment)
+        if os.path.exists(path) and os.path.getsize(path) >= self.segment_max_bytes:
+            segment += 1
+        return segment
+
+    def append_many(self, transcripts):
+        """Archive ``{ticket_id: [message dicts]}`` durably in one segment write."""
+        if not transcripts:
+            return
+        with self._lock, open(self._index_path, 'ab') as index:
+            fcntl.flock(index, fcntl.LOCK_EX)
+            try:
+                segment = self._current_segment()
+                entries = []
+                with open(self._segment_path(segment), 'ab') as f:
+                    offset = f.tell()
+                    for ticket_id, messages in transcripts.items():
+                        if not messages:
+                            entries.append((int(ticket_id), 0, 0, 0))
+                            continue
+                        payload = zlib.compress(json.dumps(messages, separators=(',', ':')).encode())
+                        record = RECORD_HEADER.pack(int(ticket_id), len(payload), zlib.crc32(payload)) + payload
+                        f.write(record)
+                        entries.append((int(ticket_id), segment, offset, len(record)))
+                        offset += len(record)
+                    f.flush()
+                    os.fsync(f.fileno())
+                index.write(b''.join(
+                    f'{ticket_id} {segment} {offset} {length}\n'.encode()
+                    for ticket_id, segment, offset, length in entries
+                ))
+                index.flush()
+                os.fsync(index.fileno())
+            finally:
+                fcntl.flock(index, fcntl.LOCK_UN)
+            self._refresh_index()
+
+    def remove(self, ticket_id):
+        with self._lock, open(self._index_path, 'ab') as index:
+            fcntl.flock(index, fcntl.LOCK_EX)
+            try:
+                index.write(f'{int(ticket_id)} - 0 0\n'.encode())
+                index.flush()
+                os.fsync(index.fileno())
+            finally:
+                fcntl.flock(index, fcntl.LOCK_UN)
+            self._refresh_index()
+
+    def _map(self, segment, end):
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped) < end:
+            # Segments only grow; remap when a record lies past the old mapping
+            if mapped is not None:
+                mapped.close()
+            with open(self._segment_path(segment), 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+        return mapped
+
+    def read(self, ticket_id):
+        """Return the archived messages for a ticket, or None if it is not archived."""
+        ticket_id = int(ticket_id)
+        with self._lock:
+            # Always catch up first: another worker may have re-archived the
+            # ticket (reopened and closed again) since the cached location
+            self._refresh_index()
+            location = self._index.get(ticket_id)
+            if location is None:
+                return None
+            segment, offset, length = location
+            if segment == 0:
+                return []
+            record = self._map(segment, offset + length)[offset:offset + length]
+
+        stored_id, payload_length, crc = RECORD_HEADER.unpack_from(record)
+        payload = record[RECORD_HEADER.size:RECORD_HEADER.size + payload_length]
+        if stored_id != ticket_id or zlib.crc32(payload) != crc:
+            raise ArchiveCorruptError(f"Archived transcript for ticket {ticket_id} is corrupt")
+        return json.loads(zlib.decompress(payload))
+
+    def read_required(self, ticket_id):
+        """Like ``read`` for a ticket the database says is archived; a missing record is an error."""
+        messages = self.read(ticket_id)
+        if messages is None:
+            raise ArchiveMissingError(f"Archived transcript for ticket {int(ticket_id)} is missing")
+        return messages
+
+    def __contains__(self, ticket_id):
+        with self._lock:
+            self._refresh_index()
+            return int(ticket_id) in self._index
+
+    def stats(self):
+        with self._lock:
+            segments = sorted({segment for segment, _, _ in self._index.values() if segment})
+            return {
+                'transcripts': len(self._index),
+                'segments': len(segments),
+                'bytes': sum(length for _, _, length in self._index.values())
+            }
@@ -88,6 +88,25 @@ function AdminDashboard() {
       );
     });
 
+    // One event for a whole bulk update
+    socket.on('tickets_updated', ({ tickets: updates }) => {
+      const changes = new Map(updates.map((update) => [update.ticket_id, update]));
+      setTickets((prev) =>
+        prev.map((ticket) => {
+          const update = changes.get(ticket.id);
+          return update
+            ? {
+                ...ticket,
+                status: update.status,
+                assigned_to: update.assigned_to,
+                closure_reason: update.reason,
+                reassigned_to: update.reassigned_to
+              }
+            : ticket;
+        })
+      );
+    });
+
     fetchTickets();
 
     return () => {
@@ -95,28 +114,10 @@ function AdminDashboard() {
       socket.off('ticket_closed');
       socket.off('ticket_reopened');
       socket.off('chat_inactive');
+      socket.off('tickets_updated');
     };
   }, [user, navigate]);
 
-  const fetchChats = async (ticketId) => {
-    try {
-      const token = localStorage.getItem('token');
-      const res = await fetch(`http://localhost:5000/api/chats/${ticketId}`, {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      });
-
-      if (!res.ok) throw new Error('Failed to fetch chats');
-
-      const data = await res.json();
-      return data;
-    } catch (err) {
-      console.error('Error fetching chats:', err);
-      return [];
-    }
-  };
-
   const fetchTickets = async () => {
     try {
       const token = localStorage.getItem('token');
@@ -176,20 +177,22 @@ function AdminDashboard() {
   const handleViewDetails = async (ticket) => {
     try {
       const token = localStorage.getItem('token');
-      const userRes = await fetch(`http://localhost:5000/api/users/${ticket.user_id}`, {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      });
-      if (!userRes.ok) throw new Error('Failed to fetch user details');
-      const userData = await userRes.json();
-
-      const chatHistory = await fetchChats(ticket.id);
+      const detailRes = await fetch(
+        `http://localhost:5000/api/tickets/${ticket.id}/detail?include=creator,messages`,
+        {
+          headers: {
+            Authorization: `Bearer ${token}`,
+          },
+        }
+      );
+      if (!detailRes.ok) throw new Error('Failed to fetch ticket details');
+      const { creator, messages } = await detailRes.json();
+      const chatHistory = messages || [];
 
       setSelectedTicketDetails({
         ...ticket,
-        userName: `${userData.first_name} ${userData.last_name}`,
-        userEmail: userData.email,
+        userName: creator ? `${creator.first_name} ${creator.last_name}` : '',
+        userEmail: creator ? creator.email : '',
       });
       setSelectedTicket({
         ...ticket,
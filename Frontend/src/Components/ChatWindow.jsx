@@ -24,6 +24,22 @@ function ChatWindow({ ticketId, readOnly = false, initialMessages = [], inactivi
   const user = useStore((state) => state.user);
   const { isConnected, error: socketError } = useSocket();
   const inactivityTimerRef = useRef(null);
+  // Newest room_seq seen (message ids double as room sequence numbers)
+  const lastSeqRef = useRef(
+    initialMessages.reduce((max, msg) => (msg.id > max ? msg.id : max), 0) || null
+  );
+  const seenSeqsRef = useRef(new Set());
+
+  // False for an event already delivered: a replay can overlap live events
+  const acceptSeq = (roomSeq) => {
+    if (roomSeq == null) return true;
+    if (seenSeqsRef.current.has(roomSeq)) return false;
+    seenSeqsRef.current.add(roomSeq);
+    if (lastSeqRef.current == null || roomSeq > lastSeqRef.current) {
+      lastSeqRef.current = roomSeq;
+    }
+    return true;
+  };
 
   // Fetch ticket status
   useEffect(() => {
@@ -80,6 +96,10 @@ function ChatWindow({ ticketId, readOnly = false, initialMessages = [], inactivi
 
   // Socket connection and listeners
   useEffect(() => {
+    const joinRoom = () => {
+      socketRef.current.emit('join', { ticket_id: ticketId, last_seq: lastSeqRef.current });
+    };
+
     if (!readOnly && ticketId && ticketId !== 'null') {
       socketRef.current = getSocket();
 
@@ -89,10 +109,12 @@ function ChatWindow({ ticketId, readOnly = false, initialMessages = [], inactivi
       }
 
       socketRef.current.on('message', (newMessage) => {
+        if (!acceptSeq(newMessage.room_seq)) return;
         setMessages(prev => [...prev, newMessage]);
       });
 
-      socketRef.current.on('ticket_closed', ({ reason, reassigned_to }) => {
+      socketRef.current.on('ticket_closed', ({ reason, reassigned_to, room_seq }) => {
+        if (!acceptSeq(room_seq)) return;
         setTicketStatus('closed');
         setMessages(prev => [
           ...prev,
@@ -106,11 +128,20 @@ function ChatWindow({ ticketId, readOnly = false, initialMessages = [], inactivi
         ]);
       });
 
-      socketRef.current.on('ticket_reopened', () => {
+      socketRef.current.on('ticket_reopened', ({ room_seq }) => {
+        if (!acceptSeq(room_seq)) return;
         setTicketStatus('assigned');
       });
 
-      socketRef.current.emit('join', { ticket_id: ticketId });
+      // A reconnect gets a new sid with no rooms: rejoin and replay only the gap
+      socketRef.current.on('connect_success', joinRoom);
+
+      socketRef.current.on('replay_done', ({ complete }) => {
+        // The gap was too long to replay; reload the whole history
+        if (!complete) fetchMessages();
+      });
+
+      joinRoom();
 
       socketRef.current.on('message_sent', (data) => {
         if (data.success) {
@@ -133,6 +164,8 @@ function ChatWindow({ ticketId, readOnly = false, initialMessages = [], inactivi
         socketRef.current.off('message_sent');
         socketRef.current.off('ticket_closed');
         socketRef.current.off('ticket_reopened');
+        socketRef.current.off('connect_success', joinRoom);
+        socketRef.current.off('replay_done');
       }
     };
   }, [ticketId, readOnly, user.id]);
@@ -149,6 +182,11 @@ function ChatWindow({ ticketId, readOnly = false, initialMessages = [], inactivi
       });
       if (!response.ok) throw new Error('Failed to fetch messages');
       const data = await response.json();
+      data.forEach((msg) => {
+        if (lastSeqRef.current == null || msg.id > lastSeqRef.current) {
+          lastSeqRef.current = msg.id;
+        }
+      });
       setMessages(data);
     } catch (error) {
       setError('Error loading messages: ' + error.message);
@@ -71,6 +71,11 @@ function MemberDashboard() {
       socketRef.current.on('ticket_reopened', ({ ticket_id }) => {
         fetchTickets();
       });
+
+      // Bulk updates can move tickets in or out of this member's list
+      socketRef.current.on('tickets_updated', () => {
+        fetchTickets();
+      });
     }
 
     return () => {
@@ -78,6 +83,7 @@ function MemberDashboard() {
         socketRef.current.off('ticket_created');
         socketRef.current.off('chat_inactive');
         socketRef.current.off('ticket_reopened');
+        socketRef.current.off('tickets_updated');
       }
     };
   }, []);
@@ -230,30 +236,22 @@ function MemberDashboard() {
       });
 
       const token = localStorage.getItem('token');
-      const userRes = await fetch(`http://localhost:5000/api/users/${ticket.user_id}`, {
-        headers: {
-          'Authorization': `Bearer ${token}`,
-        },
-      });
-      if (!userRes.ok) throw new Error('Failed to fetch user details');
-      const userData = await userRes.json();
-
-      const chatRes = 
-        await fetch(`http://localhost:5000/api/chats/${ticketId}`, {
+      const detailRes = await fetch(
+        `http://localhost:5000/api/tickets/${ticketId}/detail?include=creator,messages`,
+        {
           headers: {
             'Authorization': `Bearer ${token}`,
           },
-        });
-
-      if (!chatRes.ok) throw new Error('Failed to load chat history');
-
-      const chatHistory = await chatRes.json();
+        }
+      );
+      if (!detailRes.ok) throw new Error('Failed to load ticket details');
+      const { creator, messages } = await detailRes.json();
 
       setSelectedTicket({
         ...ticket,
-        userName: `${userData.first_name} ${userData.last_name}`,
-        userEmail: userData.email,
-        chatHistory,
+        userName: creator ? `${creator.first_name} ${creator.last_name}` : '',
+        userEmail: creator ? creator.email : '',
+        chatHistory: messages || [],
       });
     } catch (err) {
       setError(err.message);
@@ -1,10 +1,12 @@
 import React, { useState, useEffect } from 'react';
 import { Snackbar, Alert } from '@mui/material';
 import { getSocket } from './socket';
+import useStore from '../store/useStore';
 
 function Notifications() {
   const [notification, setNotification] = useState(null);
   const [open, setOpen] = useState(false);
+  const user = useStore((state) => state.user);
 
   useEffect(() => {
     const socket = getSocket();
@@ -28,12 +30,26 @@ function Notifications() {
       setOpen(true);
     });
 
+    // Bulk rejections arrive as one event for all of the user's tickets
+    socket.on('tickets_updated', ({ tickets }) => {
+      if (user?.role !== 'user') return;
+      const rejected = tickets.filter((ticket) => ticket.action === 'reject');
+      if (rejected.length === 0) return;
+      const ids = rejected.map((ticket) => `#${ticket.ticket_id}`).join(', ');
+      setNotification({
+        type: 'info',
+        message: `Your ticket${rejected.length > 1 ? 's' : ''} ${ids} ${rejected.length > 1 ? 'have' : 'has'} been rejected. Please try submitting a new ticket.`
+      });
+      setOpen(true);
+    });
+
     // Clean up listeners
     return () => {
       socket.off('ticket_accepted');
       socket.off('ticket_rejected');
+      socket.off('tickets_updated');
     };
-  }, []);
+  }, [user]);
 
   const handleClose = (event, reason) => {
     if (reason === 'clickaway') {